@@ -1,14 +1,62 @@
+import atexit
 import os
-import json
 import datetime
-from typing import Optional
+import functools
+import logging
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, Optional
 from urllib.parse import urljoin
 import httpx
 import re
 
+try:
+    # orjson parses bytes straight to dicts and is noticeably faster on large pages
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(data) -> str:
+        # Non-str keys (e.g. int issue IDs) are stringified like json.dumps does
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(data) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+logger = logging.getLogger(__name__)
+
+
+_CLIENT: Optional[httpx.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client, creating it on first use.
+    Sharing one client keeps connections to Redmine alive across calls and threads.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0))
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
 
 def request(path: str, method: str = 'get', data: Optional[dict] = None, params: Optional[dict] = None,
-            content_type: str = 'application/json', content: Optional[bytes] = None, timeout: float = 120.0) -> dict:
+            content_type: str = 'application/json', content: Optional[bytes] = None, timeout: float = 120.0,
+            etag: Optional[str] = None) -> dict:
+    """
+    Send a request to Redmine. If etag is given it is sent as If-None-Match, and a
+    304 Not Modified reply is returned as status_code 304 with an empty body.
+    """
     if data is None:
         data = {}
     if params is None:
@@ -16,19 +64,23 @@ def request(path: str, method: str = 'get', data: Optional[dict] = None, params:
     if content is None:
         content = b''
     headers = {'X-Redmine-API-Key': os.environ.get('REDMINE_API_KEY', ''), 'Content-Type': content_type}
+    if etag:
+        headers['If-None-Match'] = etag
     
     url = urljoin(os.environ.get('REDMINE_URL', ''), path)
     try:
-        response = httpx.request(method=method.lower(), url=url, json=data, params=params, headers=headers,
-                                 content=content, timeout=timeout)
+        response = _get_client().request(method=method.lower(), url=url, json=data, params=params,
+                                         headers=headers, content=content, timeout=timeout)
+        if etag and response.status_code == 304:
+            return {"status_code": 304, "body": None, "error": "", "etag": etag}
         response.raise_for_status()
         body = None
         if response.content:
             try:
-                body = response.json()
+                body = _json_loads(response.content)
             except ValueError:
                 body = response.content
-        return {"status_code": response.status_code, "body": body, "error": ""}
+        return {"status_code": response.status_code, "body": body, "error": "", "etag": response.headers.get('ETag')}
     except Exception as e:
         status_code = 0
         body = None
@@ -49,6 +101,29 @@ def request(path: str, method: str = 'get', data: Optional[dict] = None, params:
         return {"status_code": status_code, "body": body, "error": error_msg}
 
 
+def to_float(value) -> float:
+    """Convert a Redmine number or numeric string (e.g. a custom field value) to float; empty or invalid values count as 0."""
+    # estimated_hours already arrives as a JSON number, so skip the conversion for it
+    if isinstance(value, float):
+        return value
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def serialize_tool_result(data) -> str:
+    """
+    Serialize a tool return value as compact JSON for the MCP response.
+    Strings pass through unchanged; everything else is encoded without indentation,
+    which keeps large issue lists noticeably shorter than pretty-printed output.
+    """
+    if isinstance(data, str):
+        return data
+    return _json_dumps(data)
+
+
+@functools.lru_cache(maxsize=256)
 def get_week_and_month_label(date_obj: datetime.date) -> tuple[str, str]:
     """
     Given a date, return the (week_label, month_label) according to the custom week/month logic.
@@ -92,83 +167,273 @@ def get_week_and_month_label(date_obj: datetime.date) -> tuple[str, str]:
     return week_label, month_label
 
 
+_WEEK_LABEL_RE = re.compile(r'\s*(\d+)\s*주차\s*')
+
+
+@functools.lru_cache(maxsize=128)
+def parse_week_label(label: str) -> Optional[int]:
+    """
+    Return the week number of a 스프린트(주) label such as '3주차', or None if the label is not in that form.
+    """
+    match = _WEEK_LABEL_RE.fullmatch(label)
+    return int(match.group(1)) if match else None
+
+
+_PAGE_LIMIT = 100  # Redmine's maximum page size
+_PAGE_WORKERS = 8  # concurrent page requests per collection
+
+
+# (path, sorted params) -> (etag, body) of the last page seen, for conditional requests
+_ETAG_CACHE_MAX = 512
+_ETAG_CACHE = {}
+_ETAG_LOCK = threading.Lock()
+
+
+def _fetch_page(path: str, key: str, params: dict, offset: int, limit: int, conditional: bool = False) -> dict:
+    paged_params = params.copy()
+    paged_params.update({
+        'limit': limit,
+        'offset': offset
+    })
+    cache_key = (path, tuple(sorted(paged_params.items())))
+    cached = None
+    if conditional:
+        with _ETAG_LOCK:
+            cached = _ETAG_CACHE.get(cache_key)
+    result = request(path, params=paged_params, etag=cached[0] if cached else None)
+    if result["status_code"] == 304 and cached:
+        return cached[1]
+    if result["status_code"] == 200 and result["body"] and key in result["body"]:
+        if conditional and result["etag"]:
+            with _ETAG_LOCK:
+                # Re-insert so a refreshed page counts as newest; the oldest entry is dropped first
+                _ETAG_CACHE.pop(cache_key, None)
+                if len(_ETAG_CACHE) >= _ETAG_CACHE_MAX:
+                    del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+                _ETAG_CACHE[cache_key] = (result["etag"], result["body"])
+        return result["body"]
+    raise RuntimeError(f"Failed to fetch {key}: {result['error']}")
+
+
+def _iter_pages(path: str, key: str, params: dict, conditional: bool = False) -> Iterator[list]:
+    """
+    Yield the item list of every page of a paginated Redmine collection, in order.
+    The first page reveals total_count, after which the remaining pages are fetched concurrently.
+    With conditional=True, pages are revalidated by ETag and unchanged ones are served from memory.
+    """
+    body = _fetch_page(path, key, params, 0, _PAGE_LIMIT, conditional)
+    yield body[key]
+    # Redmine echoes the effective limit, which may be capped below the requested one
+    limit = body.get('limit') or _PAGE_LIMIT
+    total_count = body.get('total_count')
+    if total_count is None:
+        # No total available: walk the remaining pages one by one
+        offset = limit
+        items = body[key]
+        while len(items) >= limit:
+            items = _fetch_page(path, key, params, offset, limit, conditional)[key]
+            yield items
+            offset += limit
+        return
+    offsets = range(limit, total_count, limit)
+    if not offsets:
+        return
+    with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, len(offsets))) as executor:
+        yield from executor.map(lambda offset: _fetch_page(path, key, params, offset, limit, conditional)[key],
+                                offsets)
+
+
+def fetch_all_issues_iter(params: dict, predicate: Optional[Callable[[dict], bool]] = None) -> Iterator[dict]:
+    """
+    Yield issues from Redmine page by page using pagination, given initial params.
+    If predicate is given, only issues for which it returns true are yielded, so callers
+    never hold the unfiltered result set in memory.
+    """
+    # Pages are fetched by offset, so an issue that shifts position while the pages are
+    # being read can show up on two of them; yield each issue ID only once
+    seen_ids = set()
+    for issues in _iter_pages('/issues.json', 'issues', params):
+        for issue in issues:
+            issue_id = issue.get('id')
+            if issue_id in seen_ids:
+                continue
+            seen_ids.add(issue_id)
+            if predicate is None or predicate(issue):
+                yield issue
+
+
 def fetch_all_issues(params: dict) -> list:
     """
     Fetch all issues from Redmine using pagination, given initial params.
     Returns a combined list of all issues.
     """
-    total_issues = []
-    offset = 0
-    limit = 100
-    while True:
-        paged_params = params.copy()
-        paged_params.update({
-            'limit': limit,
-            'offset': offset
-        })
-        result = request('/issues.json', params=paged_params)
-        if result["status_code"] == 200 and result["body"] and "issues" in result["body"]:
-            issues = result["body"]["issues"]
-            total_issues.extend(issues)
-            if len(issues) < limit:
-                break
-            offset += limit
-        else:
-            raise RuntimeError(f"Failed to fetch issues: {result['error']}")
-    return total_issues
+    return list(fetch_all_issues_iter(params))
+
+
+_ISSUES_CACHE_TTL = 60.0  # seconds
+_ISSUES_CACHE = {}  # (sorted param items) -> (timestamp, issues)
+_ISSUES_INFLIGHT = {}  # (sorted param items) -> Future of the fetch currently running
+_ISSUES_LOCK = threading.Lock()
+
+
+def fetch_all_issues_cached(params: dict) -> list:
+    """
+    Like fetch_all_issues, but reuse the result of an identical query made within the last minute.
+    Paired tools (e.g. issues and hours for the same week) then share one round trip, and
+    identical queries arriving while one is in flight wait for it instead of fetching again.
+    The returned list is shared between callers and must not be mutated.
+    """
+    key = tuple(sorted(params.items()))
+    with _ISSUES_LOCK:
+        now = time.monotonic()
+        cached = _ISSUES_CACHE.get(key)
+        if cached is not None and now - cached[0] < _ISSUES_CACHE_TTL:
+            return cached[1]
+        inflight = _ISSUES_INFLIGHT.get(key)
+        if inflight is None:
+            future = _ISSUES_INFLIGHT[key] = Future()
+    if inflight is not None:
+        return inflight.result()
+    
+    try:
+        issues = fetch_all_issues(params)
+    except BaseException as e:
+        with _ISSUES_LOCK:
+            if _ISSUES_INFLIGHT.get(key) is future:
+                del _ISSUES_INFLIGHT[key]
+        future.set_exception(e)
+        raise
+    
+    with _ISSUES_LOCK:
+        now = time.monotonic()
+        # Drop expired entries so the cache only ever holds the last minute of queries
+        for stale in [k for k, (ts, _) in _ISSUES_CACHE.items() if now - ts >= _ISSUES_CACHE_TTL]:
+            del _ISSUES_CACHE[stale]
+        # Publish the result and retire the in-flight entry together, so no caller sees neither.
+        # If clear_caches() ran meanwhile, the entry is gone and the result must not be republished.
+        if _ISSUES_INFLIGHT.get(key) is future:
+            _ISSUES_CACHE[key] = (now, issues)
+            del _ISSUES_INFLIGHT[key]
+    future.set_result(issues)
+    return issues
+
+
+def group_issues_by_assignee(issues: Iterable[dict], include_unassigned: bool = False) -> dict:
+    """
+    Group issues by assignee ID.
+    Unassigned issues are left out, or collected under the key None with include_unassigned=True.
+    """
+    grouped = defaultdict(list)
+    for issue in issues:
+        assignee = issue.get('assigned_to')
+        if assignee:
+            grouped[assignee.get('id')].append(issue)
+        elif include_unassigned:
+            grouped[None].append(issue)
+    return grouped
+
+
+def fetch_issues_by_assignee(params: dict) -> dict:
+    """
+    Run one issue query across all assignees and group the results by assignee ID.
+    Unassigned issues are left out. The grouped lists share issues with the query cache and must not be mutated.
+    """
+    return group_issues_by_assignee(fetch_all_issues_cached(params))
+
+
+def iter_member_issues(users: list, params: dict) -> Iterator[tuple]:
+    """
+    Yield (name, member ID, issues) for every user with both a name and an ID.
+    The issues come from a single query for everyone, grouped by assignee, instead of one query per member;
+    members without matching issues get an empty tuple.
+    """
+    issues_by_member = fetch_issues_by_assignee(params)
+    for user in users:
+        name, member_id = user.get('name'), user.get('id')
+        if name and member_id:
+            yield name, member_id, issues_by_member.get(member_id, ())
 
 
 def fetch_all_users(params: dict = {}) -> list:
     """
     Fetch all users from Redmine using pagination, given initial params (optional).
     Returns a combined list of all users with added 'name' field.
+    Pages are revalidated with ETags, so an unchanged user list costs no response bodies.
     """
     total_users = []
-    offset = 0
-    limit = 100
-    while True:
-        paged_params = params.copy()
-        paged_params.update({
-            'limit': limit,
-            'offset': offset
-        })
-        result = request('/users.json', params=paged_params)
-        if result["status_code"] == 200 and result["body"] and "users" in result["body"]:
-            users = result["body"]["users"]
-            # Add 'name' field to each user for convenience
-            for user in users:
-                firstname = user.get('firstname', '')
-                lastname = user.get('lastname', '')
-                
-                if lastname and firstname:
-                    # Check if lastname contains Korean characters (Hangul)
-                    is_korean = bool(re.search(r'[가-힣]', lastname))
-                    if is_korean:
-                        # Korean names: lastname+firstname (no space)
-                        user['name'] = f"{lastname}{firstname}"
-                    else:
-                        # English/Latin names: lastname firstname (with space)
-                        user['name'] = f"{lastname} {firstname}"
+    for users in _iter_pages('/users.json', 'users', params, conditional=True):
+        # Add 'name' field to each user for convenience
+        for user in users:
+            firstname = user.get('firstname', '')
+            lastname = user.get('lastname', '')
+            
+            if lastname and firstname:
+                # Check if lastname contains Korean characters (Hangul)
+                is_korean = bool(re.search(r'[가-힣]', lastname))
+                if is_korean:
+                    # Korean names: lastname+firstname (no space)
+                    user['name'] = f"{lastname}{firstname}"
                 else:
-                    user['name'] = user.get('login', str(user.get('id', '')))
-            total_users.extend(users)
-            if len(users) < limit:
-                break
-            offset += limit
-        else:
-            raise RuntimeError(f"Failed to fetch users: {result['error']}")
+                    # English/Latin names: lastname firstname (with space)
+                    user['name'] = f"{lastname} {firstname}"
+            else:
+                user['name'] = user.get('login', str(user.get('id', '')))
+        total_users.extend(users)
     return total_users
 
 
+_USERS_CACHE_TTL = 300.0  # seconds
+_USERS_CACHE = {'data': None, 'ts': 0.0}
+_ACTIVE_USERS_PARAMS = {'status': 1}  # 1 = active users only
+
+
+def fetch_active_users() -> list:
+    """
+    Return all active users (see fetch_all_users), cached in memory for a few minutes.
+    The user list changes rarely, while aggregate tools ask for it on every call.
+    """
+    now = time.monotonic()
+    if _USERS_CACHE['data'] is None or now - _USERS_CACHE['ts'] >= _USERS_CACHE_TTL:
+        _USERS_CACHE['data'] = fetch_all_users(_ACTIVE_USERS_PARAMS)
+        _USERS_CACHE['ts'] = now
+    return _USERS_CACHE['data']
+
+
+def invalidate_users_cache() -> None:
+    """Drop the cached active-user list so the next call refetches it."""
+    _USERS_CACHE['data'] = None
+
+
+def name_key(name: str) -> str:
+    """
+    Normalize a name for case-insensitive lookup.
+    NFC folds decomposed Hangul (as typed on some macOS inputs) into the composed form stored in the dictionaries.
+    """
+    return unicodedata.normalize('NFC', name.strip()).casefold()
+
+
+class LowerIndex(dict):
+    """A name -> ID mapping whose keys are already normalized with name_key."""
+
+
+def lower_index(mapping: dict) -> LowerIndex:
+    """
+    Return a case-insensitive lookup index for a name -> ID mapping.
+    Build it once and pass it to the lookup helpers so they skip re-normalizing on every call.
+    """
+    if isinstance(mapping, LowerIndex):
+        return mapping
+    return LowerIndex((name_key(k), v) for k, v in mapping.items())
+
+
 def get_member_id(name: str, members=None) -> str:
     """
     Look up the member ID by name (case-insensitive). Raise ValueError if not found.
     """
     if members is None:
         raise ValueError("members dictionary must be provided")
-    name_key = name.strip().lower()
-    members_lower = {k.strip().lower(): v for k, v in members.items()}
-    member_id = members_lower.get(name_key)
+    members_lower = lower_index(members)
+    member_id = members_lower.get(name_key(name))
     if not member_id:
         raise ValueError(f"Member '{name}' not found")
     return member_id
@@ -180,51 +445,190 @@ def fetch_all_projects(params: dict = {}) -> list:
     Returns a combined list of all projects.
     """
     total_projects = []
-    offset = 0
-    limit = 100
-    while True:
-        paged_params = params.copy()
-        paged_params.update({
-            'limit': limit,
-            'offset': offset
-        })
-        result = request('/projects.json', params=paged_params)
-        if result["status_code"] == 200 and result["body"] and "projects" in result["body"]:
-            projects = result["body"]["projects"]
-            total_projects.extend(projects)
-            if len(projects) < limit:
-                break
-            offset += limit
-        else:
-            raise RuntimeError(f"Failed to fetch projects: {result['error']}")
+    for projects in _iter_pages('/projects.json', 'projects', params):
+        total_projects.extend(projects)
     return total_projects
 
 
+_PROJECTS_CACHE_TTL = 300.0  # seconds
+_PROJECTS_CACHE = {'data': None, 'ts': 0.0}
+
+
+def fetch_projects_cached() -> list:
+    """
+    Return all projects (see fetch_all_projects), cached in memory for a few minutes.
+    The project tree changes rarely, while several tools list it on every call.
+    """
+    now = time.monotonic()
+    if _PROJECTS_CACHE['data'] is None or now - _PROJECTS_CACHE['ts'] >= _PROJECTS_CACHE_TTL:
+        _PROJECTS_CACHE['data'] = fetch_all_projects()
+        _PROJECTS_CACHE['ts'] = now
+    return _PROJECTS_CACHE['data']
+
+
+def fetch_project_parent_ids() -> frozenset:
+    """
+    Return the IDs of projects that have sub-projects.
+    Derived once per cached project list, so leaf checks skip rebuilding the set on every call.
+    """
+    projects = fetch_projects_cached()
+    cached = _PROJECTS_CACHE.get('parent_ids')
+    if cached is None or cached[0] is not projects:
+        cached = _PROJECTS_CACHE['parent_ids'] = (
+            projects, frozenset(p['parent'].get('id') for p in projects if p.get('parent'))
+        )
+    return cached[1]
+
+
+def invalidate_projects_cache() -> None:
+    """Drop the cached project list so the next call refetches it."""
+    _PROJECTS_CACHE['data'] = None
+
+
 def get_project_id(project: str) -> str:
     """
     Retrieve all projects from Redmine and return the ID of the project whose name or identifier exactly matches the given project string (case-insensitive).
     Raise ValueError if not found.
+    
+    Resolutions come from a name/identifier index over the cached project list, so renames show up once that list refreshes.
     """
-    projects = fetch_all_projects()
-    project_lower = project.strip().lower()
-    for p in projects:
-        name_lower = p.get("name", "").strip().lower()
-        identifier_lower = p.get("identifier", "").strip().lower()
-        if project_lower == name_lower or project_lower == identifier_lower:
-            return str(p["id"])
-    raise ValueError(f"Project '{project}' not found")
+    key = name_key(project)
+    project_id = _project_id_index().get(key)
+    if project_id is None and _claim_project_miss_refresh():
+        # The project may have been created after the list was cached
+        invalidate_projects_cache()
+        project_id = _project_id_index().get(key)
+    if project_id is None:
+        raise ValueError(f"Project '{project}' not found")
+    return project_id
+
+
+_PROJECT_MISS_REFRESH_INTERVAL = 60.0  # seconds between refetches triggered by unknown project names
+_PROJECT_MISS_LOCK = threading.Lock()
+
+
+def _claim_project_miss_refresh() -> bool:
+    """Return True if an unknown project name may refetch the project list now, so repeated misses don't each refetch."""
+    now = time.monotonic()
+    with _PROJECT_MISS_LOCK:
+        last = _PROJECTS_CACHE.get('miss_refresh_ts')
+        if last is not None and now - last < _PROJECT_MISS_REFRESH_INTERVAL:
+            return False
+        _PROJECTS_CACHE['miss_refresh_ts'] = now
+        return True
+
+
+def _project_id_index() -> dict:
+    """Return the normalized name/identifier -> project ID index, rebuilt whenever the cached project list changes."""
+    projects = fetch_projects_cached()
+    cached = _PROJECTS_CACHE.get('id_index')
+    if cached is None or cached[0] is not projects:
+        index = {}
+        for p in projects:
+            # setdefault keeps the first project that matches, like a linear scan would
+            index.setdefault(name_key(p.get("name", "")), str(p["id"]))
+            index.setdefault(name_key(p.get("identifier", "")), str(p["id"]))
+        cached = _PROJECTS_CACHE['id_index'] = (projects, index)
+    return cached[1]
+
+
+def clear_project_id_cache() -> None:
+    """Forget all cached project name -> ID resolutions."""
+    _PROJECTS_CACHE.pop('id_index', None)
+    _PROJECTS_CACHE.pop('miss_refresh_ts', None)
+
+
+def warm_caches() -> None:
+    """Prefetch active users and the project list concurrently so the first tool call hits warm caches."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(fetch_active_users), pool.submit(fetch_projects_cached)]
+    for future in futures:
+        try:
+            future.result()
+        except Exception:
+            # Warming is best effort; the caches fill lazily on first use instead
+            pass
+    try:
+        _project_id_index()
+    except Exception:
+        pass
+
+
+_MIN_REFRESH_INTERVAL = 60.0  # seconds; refreshing faster only adds load on Redmine
+
+
+def refresh_caches() -> None:
+    """
+    Refetch the user and project lists concurrently and swap each in once its fetch succeeds.
+    Callers keep being served the previous list while a fetch runs, or if it fails.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {
+            'users': (_USERS_CACHE, pool.submit(fetch_all_users, _ACTIVE_USERS_PARAMS)),
+            'projects': (_PROJECTS_CACHE, pool.submit(fetch_all_projects)),
+        }
+    for name, (cache, future) in futures.items():
+        try:
+            data = future.result()
+        except Exception:
+            logger.exception("Failed to refresh the %s cache; keeping the previous list", name)
+            continue
+        cache['data'], cache['ts'] = data, time.monotonic()
+    # Rebuild the indexes derived from the project list now rather than on the next tool call
+    _project_id_index()
+    fetch_project_parent_ids()
+
+
+def start_cache_refresher(interval: float) -> threading.Thread:
+    """
+    Refetch the user and project lists every interval seconds on a daemon thread,
+    so tool calls keep hitting warm caches instead of paying for a refetch once the TTL lapses.
+    Intervals below _MIN_REFRESH_INTERVAL are raised to it.
+    """
+    if not interval >= _MIN_REFRESH_INTERVAL:
+        logger.warning("Cache refresh interval %r is below %.0f seconds; using %.0f", interval, _MIN_REFRESH_INTERVAL, _MIN_REFRESH_INTERVAL)
+        interval = _MIN_REFRESH_INTERVAL
+    
+    def refresh_forever():
+        while True:
+            time.sleep(interval)
+            try:
+                refresh_caches()
+            except Exception:
+                # Keep the thread alive; the next round or a lazy fetch on first use will retry
+                logger.exception("Background cache refresh failed")
+    
+    thread = threading.Thread(target=refresh_forever, name='socramine-cache-refresher', daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_caches() -> None:
+    """Clear every in-process Redmine lookup cache."""
+    clear_project_id_cache()
+    invalidate_projects_cache()
+    invalidate_users_cache()
+    with _ETAG_LOCK:
+        _ETAG_CACHE.clear()
+    with _ISSUES_LOCK:
+        _ISSUES_CACHE.clear()
+        # Orphan running fetches so their results are not cached once they finish
+        _ISSUES_INFLIGHT.clear()
+    with _ISSUE_DETAILS_LOCK:
+        _ISSUE_DETAILS_CACHE.clear()
 
 
 def parse_status_param(status: Optional[str], issue_statuses) -> str:
     """
     Convert a comma-separated status string to a pipe-separated status_id string using issue_statuses (case-insensitive).
     Redmine API uses pipe (|) as OR operator for multiple status IDs.
-    If status is None, returns '*'.
+    If status is None or '*', returns '*'.
     """
-    if status is None:
+    # '*' (all statuses) is the default for most tools, so skip the split and lookups for it
+    if status is None or status == '*':
         return '*'
-    status_names = [s.strip().lower() for s in status.split(',')]
-    issue_statuses_lower = {k.strip().lower(): v for k, v in issue_statuses.items()}
+    status_names = [name_key(s) for s in status.split(',')]
+    issue_statuses_lower = lower_index(issue_statuses)
     status_ids = [str(issue_statuses_lower.get(s, s)) for s in status_names]
     return '|'.join(status_ids)
 
@@ -236,8 +640,8 @@ def parse_priority_param(priority: Optional[str], priorities) -> str:
     """
     if priority is None:
         return ''
-    priority_names = [s.strip().lower() for s in priority.split(',')]
-    priorities_lower = {k.strip().lower(): v for k, v in priorities.items()}
+    priority_names = [name_key(s) for s in priority.split(',')]
+    priorities_lower = lower_index(priorities)
     priority_ids = [str(priorities_lower.get(s, s)) for s in priority_names]
     return '|'.join(priority_ids)
 
@@ -249,12 +653,13 @@ def parse_tracker_type_param(tracker_type: Optional[str], tracker_types) -> str:
     """
     if tracker_type is None:
         return ''
-    tracker_type_names = [s.strip().lower() for s in tracker_type.split(',')]
-    tracker_types_lower = {k.strip().lower(): v for k, v in tracker_types.items()}
+    tracker_type_names = [name_key(s) for s in tracker_type.split(',')]
+    tracker_types_lower = lower_index(tracker_types)
     tracker_type_ids = [str(tracker_types_lower.get(s, s)) for s in tracker_type_names]
     return '|'.join(tracker_type_ids)
 
 
+@functools.lru_cache(maxsize=256)
 def parse_date(date_str: str) -> datetime.date:
     """
     Parse a date string in YYYY-MM-DD format to a datetime.date object. Raise ValueError if invalid.
@@ -265,11 +670,24 @@ def parse_date(date_str: str) -> datetime.date:
         raise ValueError("selected_date must be in YYYY-MM-DD format")
 
 
-def get_issue_details(issue_id: int) -> Optional[dict]:
+@functools.lru_cache(maxsize=1024)
+def parse_date_with_labels(date_str: str) -> tuple[datetime.date, str, str]:
+    """
+    Parse a YYYY-MM-DD string and return (date, week_label, month_label).
+    Memoized per string, since tools are called back-to-back with the same selected_date.
+    """
+    date_obj = parse_date(date_str)
+    week_label, month_label = get_week_and_month_label(date_obj)
+    return date_obj, week_label, month_label
+
+
+def get_issue_details(issue_id: int, include: str = 'journals,children,attachments,relations') -> Optional[dict]:
     """
     Fetch full details for a single issue including journals (history).
+    Pass a narrower include (comma-separated) to skip associations the caller does not need.
     """
-    result = request(f'/issues/{issue_id}.json', params={'include': 'journals,children,attachments,relations'})
+    params = {'include': include} if include else {}
+    result = request(f'/issues/{issue_id}.json', params=params)
     if result["status_code"] == 200 and result["body"]:
         return result["body"].get("issue")
     return None
@@ -280,7 +698,10 @@ def get_issue_journals(issue_id: int) -> list:
     Fetch the change history (journals) for an issue.
     Returns list of journal entries with details, user, and changes.
     """
-    issue = get_issue_details(issue_id)
+    return _journal_history(get_issue_details(issue_id, include='journals'))
+
+
+def _journal_history(issue: Optional[dict]) -> list:
     if not issue:
         return []
     
@@ -312,11 +733,63 @@ def get_issue_journals(issue_id: int) -> list:
     return history
 
 
+_ISSUE_WORKERS = 8
+_ISSUE_DETAILS_CACHE_MAX = 4096
+_ISSUE_DETAILS_CACHE = {}  # (issue_id, include, updated_on) -> issue
+_ISSUE_DETAILS_LOCK = threading.Lock()
+
+
+def get_issue_details_cached(issue_id: int, updated_on: Optional[str], include: str = 'journals') -> Optional[dict]:
+    """
+    Like get_issue_details, but reuse an earlier result while the issue's updated_on is unchanged.
+    Any edit, including a new journal, bumps updated_on, so a stale entry is never returned.
+    The returned issue is shared between callers and must not be mutated.
+    """
+    key = (issue_id, include, updated_on)
+    with _ISSUE_DETAILS_LOCK:
+        cached = _ISSUE_DETAILS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    issue = get_issue_details(issue_id, include=include)
+    if issue is not None and updated_on:
+        with _ISSUE_DETAILS_LOCK:
+            if len(_ISSUE_DETAILS_CACHE) >= _ISSUE_DETAILS_CACHE_MAX:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del _ISSUE_DETAILS_CACHE[next(iter(_ISSUE_DETAILS_CACHE))]
+            _ISSUE_DETAILS_CACHE[key] = issue
+    return issue
+
+
+def get_issue_details_many(issues: Iterable[dict], include: str = 'journals') -> dict:
+    """
+    Fetch details for several issues from an index query concurrently (see get_issue_details_cached).
+    Returns a dict of issue ID -> issue, or None where the issue could not be read.
+    """
+    keys = list(dict.fromkeys((issue.get("id"), issue.get("updated_on")) for issue in issues))
+    if not keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(_ISSUE_WORKERS, len(keys))) as executor:
+        details = executor.map(lambda key: get_issue_details_cached(key[0], key[1], include), keys)
+        return {issue_id: issue for (issue_id, _), issue in zip(keys, details)}
+
+
+def get_issue_journals_many(issues: Iterable[dict]) -> dict:
+    """
+    Fetch journals for several issues from an index query concurrently (see get_issue_journals).
+    The issue index ignores include=journals, so journals can only be read per issue;
+    fetching them all up front keeps the per-issue round trips from running one after another.
+    Returns a dict of issue ID -> journal list.
+    """
+    details = get_issue_details_many(issues, include='journals')
+    return {issue_id: _journal_history(issue) for issue_id, issue in details.items()}
+
+
 def get_issue_children(issue_id: int) -> list:
     """
     Fetch child issues of a parent issue.
     """
-    issue = get_issue_details(issue_id)
+    issue = get_issue_details(issue_id, include='children')
     if not issue:
         return []
     
@@ -330,7 +803,7 @@ def get_issue_parent(issue_id: int) -> Optional[dict]:
     """
     Fetch parent issue information if it exists.
     """
-    issue = get_issue_details(issue_id)
+    issue = get_issue_details(issue_id, include='')  # parent is always part of the issue payload
     if not issue:
         return None
     
@@ -347,7 +820,7 @@ def get_issue_attachments(issue_id: int) -> list:
     """
     Fetch attachments for an issue.
     """
-    issue = get_issue_details(issue_id)
+    issue = get_issue_details(issue_id, include='attachments')
     if not issue:
         return []
     
@@ -367,49 +840,61 @@ def get_issue_attachments(issue_id: int) -> list:
     return result
 
 
-def compact_issues(issues):
+def _custom_field_values(issue: dict) -> dict:
     """
-    Return a compact list of issues with only the most relevant fields.
-    Ensures proper encoding of Unicode characters including Korean text.
-    """
-    def get_custom_field(issue, field_name):
-        for field in issue.get('custom_fields', []):
-            if field.get('name') == field_name:
-                value = field.get('value')
-                if isinstance(value, list):
-                    return ', '.join(str(v) for v in value if v)
-                return value
-        return None
+    Map custom field name -> value for an issue in a single pass over its custom_fields.
+    Multi-value fields are joined into a comma-separated string.
+    """
+    values = {}
+    for field in issue.get('custom_fields', []):
+        field_name = field.get('name')
+        if field_name in values:  # first match wins
+            continue
+        value = field.get('value')
+        if isinstance(value, list):
+            value = ', '.join(str(v) for v in value if v)
+        values[field_name] = value
+    return values
 
-    result = [
-        {
-            "id": issue.get("id"),
-            "project": issue.get("project", {}).get("name"),
-            "tracker": issue.get("tracker", {}).get("name"),
-            "status": issue.get("status", {}).get("name"),
-            "priority": issue.get("priority", {}).get("name"),
-            "author": issue.get("author", {}).get("name"),
-            "assigned_to": issue.get("assigned_to", {}).get("name"),
-            "subject": issue.get("subject"),
-            # "description": issue.get("description"),
-            "start_date": issue.get("start_date"),
-            "due_date": issue.get("due_date"),
-            "estimated_hours": issue.get("estimated_hours"),
-            "Mission Level": get_custom_field(issue, "Mission Level"),
-            "목표 년도": get_custom_field(issue, "목표 년도"),
-            "PV": get_custom_field(issue, "PV"),
-            "EV": get_custom_field(issue, "EV"),
-            "합의필요사항": get_custom_field(issue, "합의필요사항"),
-            "agreed": not bool(get_custom_field(issue, "합의필요사항")),
-            "초기계획WBS": get_custom_field(issue, "초기계획WBS"),
-            "스프린트(주)": get_custom_field(issue, "스프린트(주)"),
-            "스프린트(월)": get_custom_field(issue, "스프린트(월)"),
-        }
-        for issue in issues
-    ]
-    
-    # Ensure Unicode characters are preserved
-    return json.loads(json.dumps(result, ensure_ascii=False))
+
+def compact_issue(issue: dict) -> dict:
+    """
+    Return a compact copy of a single issue with only the most relevant fields.
+    Unicode values (including Korean text) are passed through unchanged.
+    """
+    cf = _custom_field_values(issue)
+    return {
+        "id": issue.get("id"),
+        "project": issue.get("project", {}).get("name"),
+        "tracker": issue.get("tracker", {}).get("name"),
+        "status": issue.get("status", {}).get("name"),
+        "priority": issue.get("priority", {}).get("name"),
+        "author": issue.get("author", {}).get("name"),
+        "assigned_to": issue.get("assigned_to", {}).get("name"),
+        "subject": issue.get("subject"),
+        # "description": issue.get("description"),
+        "start_date": issue.get("start_date"),
+        "due_date": issue.get("due_date"),
+        "estimated_hours": issue.get("estimated_hours"),
+        "Mission Level": cf.get("Mission Level"),
+        "목표 년도": cf.get("목표 년도"),
+        "PV": cf.get("PV"),
+        "EV": cf.get("EV"),
+        "합의필요사항": cf.get("합의필요사항"),
+        "agreed": not bool(cf.get("합의필요사항")),
+        "초기계획WBS": cf.get("초기계획WBS"),
+        "스프린트(주)": cf.get("스프린트(주)"),
+        "스프린트(월)": cf.get("스프린트(월)"),
+    }
+
+
+def compact_issues(issues: Iterable[dict]) -> list:
+    """
+    Return a compact list of issues with only the most relevant fields.
+    Accepts any iterable, including fetch_all_issues_iter, so issues are compacted as pages arrive
+    and the raw issues are never held all at once.
+    """
+    return [compact_issue(issue) for issue in issues]
 
 
 def get_all_members_weekly_plan_internal(
@@ -417,31 +902,19 @@ def get_all_members_weekly_plan_internal(
     include_unagreed: bool = True
 ) -> Optional[list]:
     """Internal helper function for weekly planning across all members."""
-    users = fetch_all_users({'status': 1})  # 1 = active users only
+    users = fetch_active_users()
     if not users:
         return None
     
-    date_obj = parse_date(selected_date)
-    week_label, month_label = get_week_and_month_label(date_obj)
+    date_obj, week_label, month_label = parse_date_with_labels(selected_date)
     
     results = []
     
-    for user in users:
-        name = user.get('name')
-        member_id = user.get('id')
-        
-        if not name or not member_id:
-            continue
-        
-        params = {
-            'assigned_to_id': member_id,
-            'cf_38': str(date_obj.year),
-            'cf_41': week_label,
-            'cf_42': month_label,
-        }
-        
-        issues = fetch_all_issues(params)
-        
+    for name, member_id, issues in iter_member_issues(users, {
+        'cf_38': str(date_obj.year),
+        'cf_41': week_label,
+        'cf_42': month_label,
+    }):
         agreed_hours = 0.0
         agreed_pv = 0.0
         unagreed_hours = 0.0
@@ -449,16 +922,13 @@ def get_all_members_weekly_plan_internal(
         
         for issue in issues:
             # Get estimated hours
-            hours = float(issue.get("estimated_hours", 0) or 0)
+            hours = to_float(issue.get("estimated_hours"))
             
             # Get PV from custom fields
             pv = 0.0
             for cf in issue.get("custom_fields", []):
                 if cf.get("name") == "PV":
-                    try:
-                        pv = float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    pv = to_float(cf.get("value"))
                     break
             
             # Check if agreed (합의필요사항 is empty)
@@ -502,30 +972,18 @@ def get_all_members_monthly_plan_internal(
     include_unagreed: bool = True
 ) -> Optional[list]:
     """Internal helper function for monthly planning across all members."""
-    users = fetch_all_users({'status': 1})  # 1 = active users only
+    users = fetch_active_users()
     if not users:
         return None
     
-    date_obj = parse_date(selected_date)
-    week_label, month_label = get_week_and_month_label(date_obj)
+    date_obj, week_label, month_label = parse_date_with_labels(selected_date)
     
     results = []
     
-    for user in users:
-        name = user.get('name')
-        member_id = user.get('id')
-        
-        if not name or not member_id:
-            continue
-        
-        params = {
-            'assigned_to_id': member_id,
-            'cf_38': str(date_obj.year),
-            'cf_42': month_label,
-        }
-        
-        issues = fetch_all_issues(params)
-        
+    for name, member_id, issues in iter_member_issues(users, {
+        'cf_38': str(date_obj.year),
+        'cf_42': month_label,
+    }):
         agreed_hours = 0.0
         agreed_pv = 0.0
         unagreed_hours = 0.0
@@ -533,16 +991,13 @@ def get_all_members_monthly_plan_internal(
         
         for issue in issues:
             # Get estimated hours
-            hours = float(issue.get("estimated_hours", 0) or 0)
+            hours = to_float(issue.get("estimated_hours"))
             
             # Get PV from custom fields
             pv = 0.0
             for cf in issue.get("custom_fields", []):
                 if cf.get("name") == "PV":
-                    try:
-                        pv = float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    pv = to_float(cf.get("value"))
                     break
             
             # Check if agreed (합의필요사항 is empty)
@@ -586,53 +1041,35 @@ def get_all_members_monthly_achievement_internal(
     issue_statuses: dict
 ) -> Optional[list]:
     """Internal helper function for monthly achievement across all members."""
-    users = fetch_all_users({'status': 1})  # 1 = active users only
+    users = fetch_active_users()
     if not users:
         return None
     
     status_id = parse_status_param(status, issue_statuses)
-    date_obj = parse_date(selected_date)
-    week_label, month_label = get_week_and_month_label(date_obj)
+    date_obj, week_label, month_label = parse_date_with_labels(selected_date)
     
     results = []
     
-    for user in users:
-        name = user.get('name')
-        member_id = user.get('id')
-        
-        if not name or not member_id:
-            continue
-        
-        params = {
-            'assigned_to_id': member_id,
-            'status_id': status_id,
-            'cf_38': str(date_obj.year),
-            'cf_42': month_label,
-        }
-        
-        issues = fetch_all_issues(params)
-        
+    for name, member_id, issues in iter_member_issues(users, {
+        'status_id': status_id,
+        'cf_38': str(date_obj.year),
+        'cf_42': month_label,
+    }):
         total_hours = 0.0
         total_pv = 0.0
         total_ev = 0.0
         
         for issue in issues:
             # Get estimated hours
-            hours = float(issue.get("estimated_hours", 0) or 0)
+            hours = to_float(issue.get("estimated_hours"))
             total_hours += hours
             
             # Get PV and EV from custom fields
             for cf in issue.get("custom_fields", []):
                 if cf.get("name") == "PV":
-                    try:
-                        total_pv += float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    total_pv += to_float(cf.get("value"))
                 elif cf.get("name") == "EV":
-                    try:
-                        total_ev += float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    total_ev += to_float(cf.get("value"))
         
         # Calculate CPI
         cpi = total_ev / total_pv if total_pv > 0 else 0.0
@@ -654,54 +1091,36 @@ def get_all_members_weekly_achievement_internal(
     issue_statuses: dict
 ) -> Optional[list]:
     """Internal helper function for weekly achievement across all members."""
-    users = fetch_all_users({'status': 1})  # 1 = active users only
+    users = fetch_active_users()
     if not users:
         return None
     
     status_id = parse_status_param(status, issue_statuses)
-    date_obj = parse_date(selected_date)
-    week_label, month_label = get_week_and_month_label(date_obj)
+    date_obj, week_label, month_label = parse_date_with_labels(selected_date)
     
     results = []
     
-    for user in users:
-        name = user.get('name')
-        member_id = user.get('id')
-        
-        if not name or not member_id:
-            continue
-        
-        params = {
-            'assigned_to_id': member_id,
-            'status_id': status_id,
-            'cf_38': str(date_obj.year),
-            'cf_41': week_label,
-            'cf_42': month_label,
-        }
-        
-        issues = fetch_all_issues(params)
-        
+    for name, member_id, issues in iter_member_issues(users, {
+        'status_id': status_id,
+        'cf_38': str(date_obj.year),
+        'cf_41': week_label,
+        'cf_42': month_label,
+    }):
         total_hours = 0.0
         total_pv = 0.0
         total_ev = 0.0
         
         for issue in issues:
             # Get estimated hours
-            hours = float(issue.get("estimated_hours", 0) or 0)
+            hours = to_float(issue.get("estimated_hours"))
             total_hours += hours
             
             # Get PV and EV from custom fields
             for cf in issue.get("custom_fields", []):
                 if cf.get("name") == "PV":
-                    try:
-                        total_pv += float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    total_pv += to_float(cf.get("value"))
                 elif cf.get("name") == "EV":
-                    try:
-                        total_ev += float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    total_ev += to_float(cf.get("value"))
         
         # Calculate CPI
         cpi = total_ev / total_pv if total_pv > 0 else 0.0
@@ -726,7 +1145,7 @@ def get_all_members_ytd_achievement_internal(
     """Internal helper function for YTD achievement across all members."""
     import datetime
     
-    users = fetch_all_users({'status': 1})  # 1 = active users only
+    users = fetch_active_users()
     if not users:
         return None
     
@@ -743,43 +1162,25 @@ def get_all_members_ytd_achievement_internal(
     
     results = []
     
-    for user in users:
-        name = user.get('name')
-        member_id = user.get('id')
-        
-        if not name or not member_id:
-            continue
-        
-        # Fetch all issues for the year with the specified status
-        params = {
-            'assigned_to_id': member_id,
-            'status_id': status_id,
-            'cf_38': str(year),
-        }
-        
-        issues = fetch_all_issues(params)
-        
+    for name, member_id, issues in iter_member_issues(users, {
+        'status_id': status_id,
+        'cf_38': str(year),
+    }):
         ytd_hours = 0.0
         ytd_pv = 0.0
         ytd_ev = 0.0
         
         for issue in issues:
             # Get estimated hours
-            hours = float(issue.get("estimated_hours", 0) or 0)
+            hours = to_float(issue.get("estimated_hours"))
             ytd_hours += hours
             
             # Get PV and EV from custom fields
             for cf in issue.get("custom_fields", []):
                 if cf.get("name") == "PV":
-                    try:
-                        ytd_pv += float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    ytd_pv += to_float(cf.get("value"))
                 elif cf.get("name") == "EV":
-                    try:
-                        ytd_ev += float(cf.get("value", 0) or 0)
-                    except ValueError:
-                        pass
+                    ytd_ev += to_float(cf.get("value"))
         
         # Calculate YTD CPI
         ytd_cpi = ytd_ev / ytd_pv if ytd_pv > 0 else 0.0
@@ -831,7 +1232,7 @@ def get_members_below_weekly_achievement_threshold_internal(
             })
     
     # Sort by hours (lowest first)
-    below_threshold.sort(key=lambda x: x['hours'])
+    below_threshold.sort(key=itemgetter('hours'))
     
     return below_threshold if below_threshold else None
 
@@ -944,16 +1345,9 @@ def find_duplicate_issues_internal(
                 
                 date_overlap = False
                 if start1 and start2 and due1 and due2:
-                    try:
-                        s1 = datetime.datetime.strptime(start1, '%Y-%m-%d').date()
-                        s2 = datetime.datetime.strptime(start2, '%Y-%m-%d').date()
-                        d1 = datetime.datetime.strptime(due1, '%Y-%m-%d').date()
-                        d2 = datetime.datetime.strptime(due2, '%Y-%m-%d').date()
-                        
-                        # Check if date ranges overlap
-                        date_overlap = not (d1 < s2 or d2 < s1)
-                    except:
-                        pass
+                    # Check if date ranges overlap
+                    # Redmine dates are zero-padded YYYY-MM-DD, so string order is date order
+                    date_overlap = not (due1 < start2 or due2 < start1)
                 
                 assignee1 = issue1.get('assigned_to', {}).get('name', 'Unassigned')
                 assignee2 = issue2.get('assigned_to', {}).get('name', 'Unassigned')
@@ -1033,8 +1427,8 @@ def find_performance_outliers_internal(
     # Filter by tracker type if specified
     if tracker_type:
         from main import tracker_types
-        tracker_type_lower = {k.strip().lower(): v for k, v in tracker_types.items()}
-        tracker_id = tracker_type_lower.get(tracker_type.strip().lower())
+        tracker_type_lower = lower_index(tracker_types)
+        tracker_id = tracker_type_lower.get(name_key(tracker_type))
         if tracker_id:
             params['tracker_id'] = str(tracker_id)
     
@@ -1061,22 +1455,16 @@ def find_performance_outliers_internal(
         # Calculate performance metrics for each issue
         metrics = []
         for issue in tracker_issues:
-            hours = float(issue.get('estimated_hours', 0) or 0)
+            hours = to_float(issue.get('estimated_hours'))
             
             # Get EV and PV from custom fields
             ev = 0.0
             pv = 0.0
             for cf in issue.get('custom_fields', []):
                 if cf.get('name') == 'EV':
-                    try:
-                        ev = float(cf.get('value', 0) or 0)
-                    except ValueError:
-                        pass
+                    ev = to_float(cf.get('value'))
                 elif cf.get('name') == 'PV':
-                    try:
-                        pv = float(cf.get('value', 0) or 0)
-                    except ValueError:
-                        pass
+                    pv = to_float(cf.get('value'))
             
             # Calculate efficiency metrics
             ev_per_hour = ev / hours if hours > 0 else 0
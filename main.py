@@ -3,20 +3,27 @@ import os
 from typing import Optional
 import json
 import datetime
+import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from helper import (
     parse_status_param,
     fetch_all_issues,
-    get_week_and_month_label,
+    fetch_all_issues_iter,
     parse_date,
+    parse_date_with_labels,
     get_member_id,
     parse_tracker_type_param,
     parse_priority_param,
+    compact_issue,
     compact_issues,
     get_project_id,
-    fetch_all_users,
-    fetch_all_projects,
-    get_issue_details,
-    get_issue_journals,
+    fetch_active_users,
+    fetch_projects_cached,
+    fetch_project_parent_ids,
+    get_issue_journals_many,
+    get_issue_details_many,
     get_issue_children,
     get_issue_parent,
     get_issue_attachments,
@@ -27,30 +34,72 @@ from helper import (
     get_all_members_ytd_achievement_internal,
     get_members_below_weekly_achievement_threshold_internal,
     find_duplicate_issues_internal,
-    find_performance_outliers_internal
+    find_performance_outliers_internal,
+    clear_caches,
+    warm_caches,
+    start_cache_refresher,
+    serialize_tool_result,
+    to_float,
+    lower_index,
+    fetch_all_issues_cached,
+    fetch_issues_by_assignee,
+    group_issues_by_assignee,
+    parse_week_label
 )
 
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-members_path = os.path.join(script_dir, "socramine_dict", "members.json")
-with open(members_path, "r", encoding="utf-8") as f:
-    members = json.load(f)
+logger = logging.getLogger(__name__)
 
-issue_statuses_path = os.path.join(script_dir, "socramine_dict", "issue_statuses.json")
-with open(issue_statuses_path, "r", encoding="utf-8") as f:
-    issue_statuses = json.load(f)
-
-priorities_path = os.path.join(script_dir, "socramine_dict", "priorities.json")
-with open(priorities_path, "r", encoding="utf-8") as f:
-    priorities = json.load(f)
+script_dir = os.path.dirname(os.path.abspath(__file__))
 
-tracker_types_path = os.path.join(script_dir, "socramine_dict", "tracker_types.json")
-with open(tracker_types_path, "r", encoding="utf-8") as f:
-    tracker_types = json.load(f)
+def _load_dict(name: str) -> dict:
+    """Load one of the bundled socramine_dict JSON files."""
+    with open(os.path.join(script_dir, "socramine_dict", name), "rb") as f:
+        return json.load(f)
+
+# Keys are normalized once here so per-call lookups are plain dict hits
+members = lower_index(_load_dict("members.json"))
+issue_statuses = lower_index(_load_dict("issue_statuses.json"))
+priorities = lower_index(_load_dict("priorities.json"))
+tracker_types = lower_index(_load_dict("tracker_types.json"))
+
+# Seoul timezone (UTC+9, no DST)
+_KST = datetime.timezone(datetime.timedelta(hours=9))
+
+# strftime patterns for get_date_time's format_type; unknown types fall back to "datetime"
+_DATE_TIME_FORMATS = {
+    "date": "%Y-%m-%d",
+    "time": "%H:%M:%S",
+    "iso": "%Y-%m-%dT%H:%M:%S+09:00",
+    "datetime": "%Y-%m-%d %H:%M:%S",
+}
+
+# Shared pool for lookups that overlap a tool's main query, so tools don't spin up threads per call
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='socramine-background')
+
+# Tracker ID of 'compy' issues
+_COMPY_TRACKER_ID = '7'
+
+# Shared filters of the performance (EV) tools
+_PERF_BASE = {
+    'status_id': '5',  # status_id=5 (완료)
+    'child_id': '!*',  # no child
+    'cf_19': '!반려',   # cf_19 != 반려 (not rejected)
+    'cf_17': '!*',     # cf_17 is not null
+}
+
+# (property, name) of the journal changes the compliance checks look for
+_CF_AGREEMENT = ('cf', '17')        # 합의필요사항
+_CF_SPRINT_WEEK = ('cf', '41')      # 스프린트(주)
+_CF_SPRINT_MONTH = ('cf', '42')     # 스프린트(월)
+_CF_WBS = ('cf', '49')              # 초기계획WBS
+_ATTR_HOURS = ('attr', 'estimated_hours')
+_ATTR_STATUS = ('attr', 'status_id')
+_REVIEW_WBS_VALUES = frozenset(("품질검토필요", "성과검토필요"))
 
 mcp = FastMCP(
     name="ThinkforBL Socramine Server",
-    dependencies=["requests"]
+    dependencies=["httpx", "orjson"],
+    tool_serializer=serialize_tool_result
 )
 
 # Date and Time
@@ -83,19 +132,125 @@ def get_date_time(format_type: Optional[str] = "datetime") -> str:
     - get_date_time("date")
     - get_date_time("iso")
     """
-    # Seoul timezone is UTC+9
-    utc_now = datetime.datetime.utcnow()
-    seoul_offset = datetime.timedelta(hours=9)
-    now_seoul = utc_now + seoul_offset
-    
-    if format_type == "date":
-        return now_seoul.strftime("%Y-%m-%d")
-    elif format_type == "time":
-        return now_seoul.strftime("%H:%M:%S")
-    elif format_type == "iso":
-        return now_seoul.strftime("%Y-%m-%dT%H:%M:%S+09:00")
-    else:  # default "datetime"
-        return now_seoul.strftime("%Y-%m-%d %H:%M:%S")
+    now_seoul = datetime.datetime.now(_KST)
+    return now_seoul.strftime(_DATE_TIME_FORMATS.get(format_type, _DATE_TIME_FORMATS["datetime"]))
+
+def _today() -> datetime.date:
+    """Today's date in Seoul."""
+    return datetime.datetime.now(_KST).date()
+
+def _journal_date(timestamp: str) -> datetime.date:
+    """UTC date of a Redmine timestamp such as '2026-01-19T01:23:45Z', read without a full datetime parse."""
+    if timestamp[4:5] == '-' and timestamp[7:8] == '-':
+        return datetime.date(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]))
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00')).date()
+
+def _user_name(user, default: str = 'Unknown') -> str:
+    """Name of a Redmine user reference such as journal['user'] or issue['assigned_to']."""
+    if isinstance(user, dict):
+        return user.get("name", default)
+    return str(user) if user else default
+
+def _user_id(user) -> Optional[int]:
+    """ID of a Redmine user reference, or None."""
+    return user.get("id") if isinstance(user, dict) else None
+
+def _current_year() -> str:
+    """The current year in Seoul, formatted for the cf_38 (목표 년도) filter."""
+    return str(_today().year)
+
+def _build_params(name: str, status: Optional[str] = '*', tracker_type: Optional[str] = None,
+                  priority: Optional[str] = None, **extra) -> dict:
+    """
+    Resolve the member/status/tracker/priority filters shared by the per-member tools into issue query params.
+    Extra keyword arguments are added last, so they can pin a filter (e.g. tracker_id='7').
+    """
+    params = {'assigned_to_id': get_member_id(name, members)}
+    status_id = parse_status_param(status, issue_statuses)
+    if status_id is not None:
+        params['status_id'] = status_id
+    tracker_type_id = parse_tracker_type_param(tracker_type, tracker_types) if tracker_type is not None else None
+    if tracker_type_id:
+        params['tracker_id'] = tracker_type_id
+    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
+    if priority_id:
+        params['priority_id'] = priority_id
+    params.update(extra)
+    return params
+
+def _sum_hours(issues: list) -> float:
+    """Total estimated_hours of the given issues."""
+    return sum((to_float(issue.get("estimated_hours")) for issue in issues), 0.0)
+
+def _sum_hours_and_ev(issues: list) -> dict:
+    """Total estimated hours and EV of the given issues in a single pass."""
+    total_hours = 0.0
+    total_ev = 0.0
+    for issue in issues:
+        total_hours += to_float(issue.get("estimated_hours"))
+        # Find EV in custom_fields; an issue carries each field once, so stop at the first hit
+        for cf in issue.get("custom_fields", ()):
+            if cf.get("name") == "EV":
+                total_ev += to_float(cf.get("value"))
+                break
+    return {"total_hours": total_hours, "total_ev": total_ev}
+
+def _period_query(name: str, selected_date: str, status: Optional[str] = '*', tracker_type: Optional[str] = None,
+                  priority: Optional[str] = None, *, scope: str, tracker_id: Optional[str] = None,
+                  mode: str = 'issues'):
+    """
+    Shared body of the week/month/year tools.
+    scope is 'week', 'month' or 'year'; mode 'issues' returns compact issues (or None), 'hours' their total.
+    """
+    date_obj, week_label, month_label = parse_date_with_labels(selected_date)
+    extra = {'cf_38': str(date_obj.year)}
+    if scope == 'week':
+        extra['cf_41'] = week_label
+    if scope in ('week', 'month'):
+        extra['cf_42'] = month_label
+    if tracker_id:
+        extra['tracker_id'] = tracker_id
+    params = _build_params(name, status, tracker_type, priority, **extra)
+    issues = fetch_all_issues_cached(params)
+    if mode == 'hours':
+        return _sum_hours(issues)
+    return compact_issues(issues) if issues else None
+
+def _plan_shortfalls(all_plans: Optional[list], threshold: float) -> Optional[list]:
+    """Members from a plan report whose total hours fall below threshold, lowest first."""
+    if not all_plans:
+        return None
+    below_threshold = [
+        {
+            'name': member['name'],
+            'hours': member['total_hours'],
+            'pv': member['total_pv'],
+            'shortfall': threshold - member['total_hours'],
+            'agreed_hours': member['agreed_hours'],
+            'agreed_pv': member['agreed_pv']
+        }
+        for member in all_plans if member['total_hours'] < threshold
+    ]
+    below_threshold.sort(key=itemgetter('hours'))
+    return below_threshold if below_threshold else None
+
+def _achievement_shortfalls(all_achievements: Optional[list], threshold: float) -> Optional[list]:
+    """Members from an achievement report whose hours fall below threshold, lowest first."""
+    if not all_achievements:
+        return None
+    below_threshold = [
+        {
+            'name': member['name'],
+            'hours': member['hours'],
+            'ev': member['ev'],
+            'pv': member['pv'],
+            'cpi': member['cpi'],
+            'shortfall': threshold - member['hours']
+        }
+        for member in all_achievements if member['hours'] < threshold
+    ]
+    below_threshold.sort(key=itemgetter('hours'))
+    return below_threshold if below_threshold else None
 
 # Weekly and Monthly Issues and Hours
 @mcp.tool()
@@ -139,27 +294,7 @@ def get_issues_per_week_by_date(
     - get_issues_per_week_by_date(name="Steven", selected_date="2025-08-28")
     - get_issues_per_week_by_date(name="Alice", selected_date="2025-08-01", status="*")
     """
-    member_id = get_member_id(name, members)
-    status_id = parse_status_param(status, issue_statuses)
-    tracker_type_id = parse_tracker_type_param(tracker_type, tracker_types) if tracker_type is not None else None
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
-    
-    week_label, month_label = get_week_and_month_label(date_obj)
-    params = {
-        'assigned_to_id': member_id, 
-        'cf_38': str(date_obj.year), 
-        'cf_41': week_label, 
-        'cf_42': month_label, 
-    }
-    if status_id is not None:
-        params['status_id'] = status_id
-    if tracker_type_id:
-        params['tracker_id'] = tracker_type_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    issues = fetch_all_issues(params)
-    return compact_issues(issues) if issues else None
+    return _period_query(name, selected_date, status, tracker_type, priority, scope='week')
 
 @mcp.tool()
 def get_hours_per_week_by_date(
@@ -189,33 +324,7 @@ def get_hours_per_week_by_date(
     Usage examples:
     - get_hours_per_week_by_date(name="Steven", selected_date="2025-08-28")
     """
-    member_id = get_member_id(name, members)
-    status_id = parse_status_param(status, issue_statuses)
-    tracker_type_id = parse_tracker_type_param(tracker_type, tracker_types) if tracker_type is not None else None
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
-    
-    week_label, month_label = get_week_and_month_label(date_obj)
-    params = {
-        'assigned_to_id': member_id, 
-        'cf_38': str(date_obj.year), 
-        'cf_41': week_label, 
-        'cf_42': month_label, 
-    }
-    if status_id is not None:
-        params['status_id'] = status_id
-    if tracker_type_id:
-        params['tracker_id'] = tracker_type_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    issues = fetch_all_issues(params)
-    total_hours = 0.0
-    for issue in issues:
-        try:
-            total_hours += float(issue.get("estimated_hours", 0) or 0)
-        except ValueError:
-            pass
-    return total_hours
+    return _period_query(name, selected_date, status, tracker_type, priority, scope='week', mode='hours')
 
 @mcp.tool()
 def get_issues_per_month_by_date(
@@ -246,26 +355,7 @@ def get_issues_per_month_by_date(
     Usage example:
     - get_issues_per_month_by_date(name="Steven", selected_date="2025-08-28")
     """
-    member_id = get_member_id(name, members)
-    status_id = parse_status_param(status, issue_statuses)
-    tracker_type_id = parse_tracker_type_param(tracker_type, tracker_types) if tracker_type is not None else None
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
-    
-    week_label, month_label = get_week_and_month_label(date_obj)
-    params = {
-        'assigned_to_id': member_id, 
-        'cf_38': str(date_obj.year), 
-        'cf_42': month_label, 
-    }
-    if status_id is not None:
-        params['status_id'] = status_id
-    if tracker_type_id:
-        params['tracker_id'] = tracker_type_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    issues = fetch_all_issues(params)
-    return compact_issues(issues) if issues else None
+    return _period_query(name, selected_date, status, tracker_type, priority, scope='month')
 
 @mcp.tool()
 def get_hours_per_month_by_date(
@@ -293,32 +383,7 @@ def get_hours_per_month_by_date(
     Usage example:
     - get_hours_per_month_by_date(name="Steven", selected_date="2025-08-28")
     """
-    member_id = get_member_id(name, members)
-    status_id = parse_status_param(status, issue_statuses)
-    tracker_type_id = parse_tracker_type_param(tracker_type, tracker_types) if tracker_type is not None else None
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
-    
-    week_label, month_label = get_week_and_month_label(date_obj)
-    params = {
-        'assigned_to_id': member_id, 
-        'cf_38': str(date_obj.year), 
-        'cf_42': month_label, 
-    }
-    if status_id is not None:
-        params['status_id'] = status_id
-    if tracker_type_id:
-        params['tracker_id'] = tracker_type_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    issues = fetch_all_issues(params)
-    total_hours = 0.0
-    for issue in issues:
-        try:
-            total_hours += float(issue.get("estimated_hours", 0) or 0)
-        except ValueError:
-            pass
-    return total_hours
+    return _period_query(name, selected_date, status, tracker_type, priority, scope='month', mode='hours')
 
 # General Issues
 @mcp.tool()
@@ -356,26 +421,14 @@ def get_issues(
     - get_issues(name="Alice", status="*", tracker_type="Bug")
     - get_issues(name="Bob", project="ProjectX", start_date="2025-01-01", due_date="2025-12-31")
     """
-    member_id = get_member_id(name, members)
-    project_id = get_project_id(project) if project is not None else None
-    status_id = parse_status_param(status, issue_statuses)
-    tracker_type_id = parse_tracker_type_param(tracker_type, tracker_types) if tracker_type is not None else None
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    params = {'assigned_to_id': member_id, 'cf_38': str(datetime.datetime.now().year)}
-    if project_id:
-        params['project_id'] = project_id
+    params = _build_params(name, status, tracker_type, priority, cf_38=_current_year())
+    if project is not None:
+        params['project_id'] = get_project_id(project)
     if start_date:
         params['start_date'] = start_date
     if due_date:
         params['due_date'] = due_date
-    if status_id is not None:
-        params['status_id'] = status_id
-    if tracker_type_id:
-        params['tracker_id'] = tracker_type_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    issues = fetch_all_issues(params)
-    return compact_issues(issues) if issues else None
+    return compact_issues(fetch_all_issues_iter(params)) or None
 
 # Compy
 @mcp.tool()
@@ -406,24 +459,7 @@ def get_this_month_compy_issues_by_date(
     - get_this_month_compy_issues_by_date(name="Alice", selected_date="2025-08-28")
     - get_this_month_compy_issues_by_date(name="Steven", selected_date="2025-11-11", status="*")
     """
-    member_id = get_member_id(name, members)
-    status_id = parse_status_param(status, issue_statuses)
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
-    
-    week_label, month_label = get_week_and_month_label(date_obj)
-    params = {
-        'assigned_to_id': member_id,  
-        'cf_38': str(date_obj.year), 
-        'cf_42': month_label, 
-    }
-    if status_id is not None:
-        params['status_id'] = status_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    params['tracker_id'] = '7'
-    issues = fetch_all_issues(params)
-    return compact_issues(issues) if issues else None
+    return _period_query(name, selected_date, status, priority=priority, scope='month', tracker_id=_COMPY_TRACKER_ID)
 
 @mcp.tool()
 def get_this_month_compy_hour_by_date(
@@ -452,30 +488,7 @@ def get_this_month_compy_hour_by_date(
     - get_this_month_compy_hour_by_date(name="Steven", selected_date="2025-08-28")
     - get_this_month_compy_hour_by_date(name="Alice", selected_date="2025-11-11", status="*")
     """
-    member_id = get_member_id(name, members)
-    status_id = parse_status_param(status, issue_statuses)
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
-    
-    week_label, month_label = get_week_and_month_label(date_obj)
-    params = {
-        'assigned_to_id': member_id,  
-        'cf_38': str(date_obj.year), 
-        'cf_42': month_label, 
-    }
-    if status_id is not None:
-        params['status_id'] = status_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    params['tracker_id'] = '7'
-    issues = fetch_all_issues(params)
-    total_hours = 0.0
-    for issue in issues:
-        try:
-            total_hours += float(issue.get("estimated_hours", 0) or 0)
-        except ValueError:
-            pass
-    return total_hours
+    return _period_query(name, selected_date, status, priority=priority, scope='month', tracker_id=_COMPY_TRACKER_ID, mode='hours')
 
 @mcp.tool()
 def get_this_year_compy_issues_by_date(
@@ -505,22 +518,7 @@ def get_this_year_compy_issues_by_date(
     - get_this_year_compy_issues_by_date(name="Steven", selected_date="2025-08-28")
     - get_this_year_compy_issues_by_date(name="Bob", selected_date="2025-11-11", status="*")
     """
-    member_id = get_member_id(name, members)
-    status_id = parse_status_param(status, issue_statuses)
-    priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
-    
-    params = {
-        'assigned_to_id': member_id, 
-        'cf_38': str(date_obj.year)
-    }
-    if status_id is not None:
-        params['status_id'] = status_id
-    if priority_id:
-        params['priority_id'] = priority_id
-    params['tracker_id'] = '7'
-    issues = fetch_all_issues(params)
-    return compact_issues(issues) if issues else None
+    return _period_query(name, selected_date, status, priority=priority, scope='year', tracker_id=_COMPY_TRACKER_ID)
 
 @mcp.tool()
 def get_this_year_compy_hour_by_date(
@@ -533,8 +531,8 @@ def get_this_year_compy_hour_by_date(
     Calculate the total estimated hours for 'compy' issues (tracker_id=7) 
     assigned to a member for the year of a given date.
     
-    Note: When asked for "all employees" or "everyone", first call get_all_users() to get 
-    the list of users, then call this function for each user.
+    Note: When asked for "all employees" or "everyone", use get_this_year_compy_hours_all_members()
+    instead, which answers for every member in a single query.
 
     Parameters:
     - name (str): Member name (required).
@@ -552,28 +550,70 @@ def get_this_year_compy_hour_by_date(
     - get_this_year_compy_hour_by_date(name="Alice", selected_date="2025-08-28")
     - get_this_year_compy_hour_by_date(name="Steven", selected_date="2025-11-11", status="*")
     """
-    member_id = get_member_id(name, members)
+    return _period_query(name, selected_date, status, priority=priority, scope='year', tracker_id=_COMPY_TRACKER_ID, mode='hours')
+
+@mcp.tool()
+def get_this_year_compy_hours_all_members(
+    selected_date: str,
+    status: Optional[str] = '*',
+    priority: Optional[str] = None,
+) -> Optional[dict]:
+    """
+    Calculate the total estimated hours for 'compy' issues (tracker_id=7) 
+    for every member for the year of a given date.
+    
+    Use this instead of calling get_this_year_compy_hour_by_date() once per user when asked
+    for "all employees" or "everyone".
+
+    Parameters:
+    - selected_date (str): Concrete date in YYYY-MM-DD format.
+      The tool determines the year automatically.
+    - status (str, optional): Issue status. Valid values: '신규', '진행 중', '검수대기', 
+      '승인대기', '완료됨', '반려됨', '계획 수립 필요', '계획 검토 필요(진행 중)', '보류됨', 
+      '완료요청', '구현됨', or '*' for all statuses. Defaults to '*'.
+    - priority (str, optional): Priority filter.
+
+    Returns:
+    - dict | None: Mapping of assignee name to total estimated compy hours.
+      Unassigned issues are grouped under 'Unassigned'. Assignees sharing a name are listed
+      separately as 'Name (#user_id)'.
+      Returns None if no compy issues found.
+
+    Usage examples:
+    - get_this_year_compy_hours_all_members(selected_date="2025-08-28")
+    - get_this_year_compy_hours_all_members(selected_date="2025-11-11", status="완료됨")
+    """
+    date_obj = parse_date(selected_date)
     status_id = parse_status_param(status, issue_statuses)
     priority_id = parse_priority_param(priority, priorities) if priority is not None else None
-    date_obj = parse_date(selected_date)
     
     params = {
-        'assigned_to_id': member_id, 
-        'cf_38': str(date_obj.year)
+        'cf_38': str(date_obj.year),
+        'tracker_id': _COMPY_TRACKER_ID
     }
     if status_id is not None:
         params['status_id'] = status_id
     if priority_id:
         params['priority_id'] = priority_id
-    params['tracker_id'] = '7'
-    issues = fetch_all_issues(params)
-    total_hours = 0.0
-    for issue in issues:
-        try:
-            total_hours += float(issue.get("estimated_hours", 0) or 0)
-        except ValueError:
-            pass
-    return total_hours
+    
+    # Group by assignee ID: display names are not unique, and same-named users must not be summed together
+    issues_by_assignee = group_issues_by_assignee(fetch_all_issues_iter(params), include_unassigned=True)
+    names = {
+        assignee_id: _user_name(issues[0].get('assigned_to'))
+        for assignee_id, issues in issues_by_assignee.items() if assignee_id is not None
+    }
+    name_counts = Counter(names.values())
+    
+    hours_by_user = {}
+    for assignee_id, issues in issues_by_assignee.items():
+        if assignee_id is None:
+            user = 'Unassigned'
+        elif name_counts[names[assignee_id]] > 1 or names[assignee_id] == 'Unassigned':
+            user = f"{names[assignee_id]} (#{assignee_id})"
+        else:
+            user = names[assignee_id]
+        hours_by_user[user] = _sum_hours(issues)
+    return hours_by_user or None
 
 @mcp.tool()
 def get_unagreed_compy_issues_by_year(
@@ -615,7 +655,7 @@ def get_unagreed_compy_issues_by_year(
     
     params = {
         'cf_38': str(date_obj.year),
-        'tracker_id': '7',  # compy
+        'tracker_id': _COMPY_TRACKER_ID,
         'cf_18': '*'  # cf_18 is '합의필요사항' - must have value (not agreed)
     }
     
@@ -628,8 +668,7 @@ def get_unagreed_compy_issues_by_year(
     if priority_id:
         params['priority_id'] = priority_id
     
-    issues = fetch_all_issues(params)
-    return compact_issues(issues) if issues else None
+    return compact_issues(fetch_all_issues_iter(params)) or None
 
 # Performance
 @mcp.tool()
@@ -655,15 +694,8 @@ def get_this_month_performance_issues_ev(
     - get_this_month_performance_issues_ev(name="Steven")
     """
     member_id = get_member_id(name, members)
-    params = {
-        'assigned_to_id': member_id,
-        'status_id': '5',  # status_id=5 (완료)
-        'due_date': 'm',   # due this month
-        'child_id': '!*',  # no child
-        'cf_19': '!반려',   # cf_19 != 반려 (not rejected)
-        'cf_17': '!*',     # cf_17 is not null
-    }
-    issues = fetch_all_issues(params)
+    params = {**_PERF_BASE, 'assigned_to_id': member_id, 'due_date': 'm'}  # due this month
+    issues = fetch_all_issues_cached(params)
     return compact_issues(issues) if issues else None
 
 @mcp.tool()
@@ -688,30 +720,9 @@ def get_this_month_performance_hour_ev(
     - get_this_month_performance_hour_ev(name="Steven")
     """
     member_id = get_member_id(name, members)
-    params = {
-        'assigned_to_id': member_id,
-        'status_id': '5',  # status_id=5 (완료)
-        'due_date': 'm',   # due this month
-        'child_id': '!*',  # no child
-        'cf_19': '!반려',   # cf_19 != 반려 (not rejected)
-        'cf_17': '!*',     # cf_17 is not null
-    }
-    issues = fetch_all_issues(params)
-    total_hours = 0.0
-    total_ev = 0.0
-    for issue in issues:
-        try:
-            total_hours += float(issue.get("estimated_hours", 0) or 0)
-        except ValueError:
-            pass
-        # Find EV in custom_fields
-        for cf in issue.get("custom_fields", []):
-            if cf.get("name") == "EV":
-                try:
-                    total_ev += float(cf.get("value", 0) or 0)
-                except ValueError:
-                    pass
-    return {"total_hours": total_hours, "total_ev": total_ev}
+    params = {**_PERF_BASE, 'assigned_to_id': member_id, 'due_date': 'm'}  # due this month
+    issues = fetch_all_issues_cached(params)
+    return _sum_hours_and_ev(issues)
 
 @mcp.tool()
 def get_this_year_performance_issues_ev(
@@ -736,16 +747,8 @@ def get_this_year_performance_issues_ev(
     - get_this_year_performance_issues_ev(name="Alice")
     """
     member_id = get_member_id(name, members)
-    
-    params = {
-        'assigned_to_id': member_id,
-        'status_id': '5',   # status_id=5 (완료)
-        'due_date': 'y',    # due this year
-        'child_id': '!*',   # no child
-        'cf_19': '!반려',    # cf_19 != 반려 (not rejected)
-        'cf_17': '!*',      # cf_17 is not null
-    }
-    issues = fetch_all_issues(params)
+    params = {**_PERF_BASE, 'assigned_to_id': member_id, 'due_date': 'y'}  # due this year
+    issues = fetch_all_issues_cached(params)
     return compact_issues(issues) if issues else None
 
 @mcp.tool()
@@ -770,31 +773,9 @@ def get_this_year_performance_hour_ev(
     - get_this_year_performance_hour_ev(name="Alice")
     """
     member_id = get_member_id(name, members)
-    
-    params = {
-        'assigned_to_id': member_id,
-        'status_id': '5',   # status_id=5 (완료)
-        'due_date': 'y',    # due this year
-        'child_id': '!*',   # no child
-        'cf_19': '!반려',    # cf_19 != 반려 (not rejected)
-        'cf_17': '!*',      # cf_17 is not null
-    }
-    issues = fetch_all_issues(params)
-    total_hours = 0.0
-    total_ev = 0.0
-    for issue in issues:
-        try:
-            total_hours += float(issue.get("estimated_hours", 0) or 0)
-        except ValueError:
-            pass
-        # Find EV in custom_fields
-        for cf in issue.get("custom_fields", []):
-            if cf.get("name") == "EV":
-                try:
-                    total_ev += float(cf.get("value", 0) or 0)
-                except ValueError:
-                    pass
-    return {"total_hours": total_hours, "total_ev": total_ev}
+    params = {**_PERF_BASE, 'assigned_to_id': member_id, 'due_date': 'y'}  # due this year
+    issues = fetch_all_issues_cached(params)
+    return _sum_hours_and_ev(issues)
 
 # Projects
 @mcp.tool()
@@ -816,22 +797,15 @@ def get_all_projects() -> Optional[list]:
     Usage examples:
     - get_all_projects()
     """
-    all_projects = fetch_all_projects()
+    all_projects = fetch_projects_cached()
     if not all_projects:
         return None
     
-    # Build a set of all parent project IDs
-    parent_ids = set()
-    for project in all_projects:
-        parent = project.get('parent')
-        if parent:
-            parent_ids.add(parent.get('id'))
+    # Parent project IDs, cached alongside the project list
+    parent_ids = fetch_project_parent_ids()
     
-    # Filter to only leaf projects (projects that are not parents)
-    leaf_projects = [p for p in all_projects if p.get('id') not in parent_ids]
-    
-    # Return only essential fields to avoid context length issues
-    # Removed description field as it can be very long
+    # Keep only leaf projects (projects that are not parents), with only essential fields
+    # to avoid context length issues. Removed description field as it can be very long
     compact_projects = [
         {
             'id': p.get('id'),
@@ -839,12 +813,28 @@ def get_all_projects() -> Optional[list]:
             'identifier': p.get('identifier'),
             'status': p.get('status')
         }
-        for p in leaf_projects
+        for p in all_projects if p.get('id') not in parent_ids
     ]
     
     return compact_projects if compact_projects else None
 
 
+def _delayed_tasks_params(project_id: Optional[str] = None) -> dict:
+    """Build issue query params that match delayed tasks, optionally within one project."""
+    today = _today()
+    
+    # Overdue issues with status '신규' (1) or '진행 중' (2), in one query
+    # These are the only statuses that count as delayed when overdue
+    yesterday = today - datetime.timedelta(days=1)
+    params = {
+        'status_id': '1|2',  # 1='신규', 2='진행 중'
+        'due_date': f'<={yesterday.isoformat()}'  # due_date < today, filtered server-side
+    }
+    if project_id:
+        params['project_id'] = project_id
+    return params
+
+
 @mcp.tool()
 def get_delayed_tasks_by_project(project: str) -> Optional[dict]:
     """
@@ -878,49 +868,20 @@ def get_delayed_tasks_by_project(project: str) -> Optional[dict]:
     - get_delayed_tasks_by_project(project="project-identifier")
     """
     project_id = get_project_id(project)
+    params = _delayed_tasks_params(project_id)
     
-    # Get current date in Seoul timezone
-    utc_now = datetime.datetime.utcnow()
-    seoul_offset = datetime.timedelta(hours=9)
-    today = (utc_now + seoul_offset).date()
-    
-    # Fetch issues with status '신규' (1) or '진행 중' (2)
-    # These are the only statuses that count as delayed when overdue
-    delayed_tasks = []
-    
-    for status_id in ['1', '2']:  # 1='신규', 2='진행 중'
-        params = {
-            'project_id': project_id,
-            'status_id': status_id
-        }
-        
-        issues = fetch_all_issues(params)
-        
-        # Filter for tasks with due_date < today
-        for issue in issues:
-            due_date_str = issue.get('due_date')
-            
-            if due_date_str:
-                try:
-                    due_date = datetime.datetime.strptime(due_date_str, '%Y-%m-%d').date()
-                    # Check if overdue
-                    if due_date < today:
-                        delayed_tasks.append(issue)
-                except ValueError:
-                    # Skip issues with invalid date format
-                    pass
+    # Compact each task as pages arrive, so full issues are not retained
+    # The server filter already drops issues without a due date; keep the guard anyway
+    delayed_tasks = [compact_issue(task) for task in
+                     fetch_all_issues_iter(params, predicate=lambda issue: bool(issue.get('due_date')))]
     
     if not delayed_tasks:
         return None
     
-    # Calculate total hours
-    total_hours = 0.0
-    for task in delayed_tasks:
-        total_hours += float(task.get("estimated_hours", 0) or 0)
-    
     return {
-        "tasks": compact_issues(delayed_tasks),
-        "total_hours": total_hours,
+        "tasks": delayed_tasks,
+        # Compact tasks keep estimated_hours, so the total can be taken from them
+        "total_hours": _sum_hours(delayed_tasks),
         "task_count": len(delayed_tasks)
     }
 
@@ -948,58 +909,27 @@ def get_all_projects_with_delayed_tasks() -> Optional[list]:
     Usage examples:
     - get_all_projects_with_delayed_tasks()
     """
-    # Get current date in Seoul timezone
-    utc_now = datetime.datetime.utcnow()
-    seoul_offset = datetime.timedelta(hours=9)
-    today = (utc_now + seoul_offset).date()
+    # Load the parent project IDs in the background while the issue query runs
+    parent_ids_future = _BACKGROUND_POOL.submit(fetch_project_parent_ids)
     
-    # Fetch ALL delayed tasks across all projects in just 2 API calls
-    # This is much faster than querying each project individually
-    all_delayed_tasks = []
-    
-    for status_id in ['1', '2']:  # 1='신규', 2='진행 중'
-        params = {
-            'status_id': status_id
-        }
-        
-        try:
-            issues = fetch_all_issues(params)
-            
-            # Filter for tasks with due_date < today
-            for issue in issues:
-                due_date_str = issue.get('due_date')
-                
-                if due_date_str:
-                    try:
-                        due_date = datetime.datetime.strptime(due_date_str, '%Y-%m-%d').date()
-                        # Check if overdue
-                        if due_date < today:
-                            all_delayed_tasks.append(issue)
-                    except ValueError:
-                        pass
-        except Exception:
-            continue
+    # Fetch ALL delayed tasks across all projects in one server-filtered query
+    # This is much faster than querying each project, or each status, individually
+    try:
+        all_delayed_tasks = [issue for issue in fetch_all_issues_iter(_delayed_tasks_params()) if issue.get('due_date')]
+    except Exception as e:
+        # Still answer "no delayed tasks", but leave a trace so a Redmine failure is not mistaken for an empty result
+        logger.warning("Failed to fetch delayed tasks: %s", e)
+        all_delayed_tasks = []
     
     if not all_delayed_tasks:
         return None
     
-    # Get all projects to build project name lookup
-    all_projects = fetch_all_projects()
-    if not all_projects:
-        return None
-    
-    # Build project ID to name mapping
-    project_map = {p.get('id'): p.get('name') for p in all_projects}
-    
-    # Build a set of all parent project IDs to identify leaf projects
-    parent_ids = set()
-    for project in all_projects:
-        parent = project.get('parent')
-        if parent:
-            parent_ids.add(parent.get('id'))
+    # Parent project IDs identify leaf projects (names come with each issue)
+    parent_ids = parent_ids_future.result()
     
     # Group delayed tasks by project
-    project_delays = {}
+    project_delays = defaultdict(lambda: {'task_count': 0, 'total_hours': 0.0})
+    project_names = {}
     
     for task in all_delayed_tasks:
         project = task.get('project')
@@ -1008,27 +938,64 @@ def get_all_projects_with_delayed_tasks() -> Optional[list]:
             
         project_id = project.get('id')
         
-        # Only include leaf projects (not parent projects)
-        if project_id in parent_ids:
-            continue
-        
-        if project_id not in project_delays:
-            project_delays[project_id] = {
+        # Redmine embeds {id, name} of the issue's project, so no separate name lookup is needed
+        project_names[project_id] = project.get('name', 'Unknown')
+        entry = project_delays[project_id]
+        entry['task_count'] += 1
+        entry['total_hours'] += to_float(task.get("estimated_hours"))
+    
+    # Convert to list and sort by project name, keeping only leaf projects (not parent projects)
+    projects_with_delays = sorted(
+        (
+            {
                 'project_id': project_id,
-                'project_name': project_map.get(project_id, 'Unknown'),
-                'task_count': 0,
-                'total_hours': 0.0
+                'project_name': project_names[project_id],
+                **totals
             }
-        
-        project_delays[project_id]['task_count'] += 1
-        project_delays[project_id]['total_hours'] += float(task.get("estimated_hours", 0) or 0)
-    
-    # Convert to list and sort by project name
-    projects_with_delays = sorted(project_delays.values(), key=lambda x: x['project_name'])
+            for project_id, totals in project_delays.items()
+            if project_id not in parent_ids
+        ),
+        key=itemgetter('project_name')
+    )
     
     return projects_with_delays if projects_with_delays else None
 
 
+@mcp.tool()
+def get_delayed_tasks_for_all_users(project: Optional[str] = None) -> Optional[dict]:
+    """
+    Get delayed tasks grouped by assignee, for all users at once.
+    
+    Use this instead of calling get_all_users() and then a per-user tool when the user
+    asks about delayed/overdue work "for everyone", "per person", or "by assignee".
+    
+    A task is considered delayed if:
+    - It has a due date that is in the past (before today)
+    - It has status '신규' (new) or '진행 중' (in progress)
+    
+    Parameters:
+    - project (str, optional): Project name or identifier. If None, covers all projects.
+    
+    Returns:
+    - dict | None: Mapping of assignee name to their delayed tasks (compact issue list).
+      Unassigned tasks are grouped under 'Unassigned'.
+      Returns None if no delayed tasks found.
+    
+    Usage examples:
+    - get_delayed_tasks_for_all_users()
+    - get_delayed_tasks_for_all_users(project="My Project")
+    """
+    project_id = get_project_id(project) if project is not None else None
+    params = _delayed_tasks_params(project_id)
+    
+    tasks_by_user = defaultdict(list)
+    for task in fetch_all_issues_iter(params, predicate=lambda issue: bool(issue.get('due_date'))):
+        assignee = task.get('assigned_to', {}).get('name', 'Unassigned')
+        tasks_by_user[assignee].append(compact_issue(task))
+    
+    return dict(tasks_by_user) if tasks_by_user else None
+
+
 # Users
 @mcp.tool()
 def get_all_users() -> Optional[list]:
@@ -1060,7 +1027,7 @@ def get_all_users() -> Optional[list]:
     - When user asks "show compy hours for all employees", call this first, then iterate through 
       each user calling get_this_year_compy_hour_by_date(name=user['name'], ...) for each one
     """
-    users = fetch_all_users({'status': 1})  # 1 = active users only
+    users = fetch_active_users()
     return users if users else None
 
 
@@ -1179,28 +1146,7 @@ def get_members_below_weekly_threshold(
     - get_members_below_weekly_threshold(selected_date="2026-01-27")
     - get_members_below_weekly_threshold(selected_date="2026-01-27", threshold=40.0, include_unagreed=True)
     """
-    all_plans = get_all_members_weekly_plan_internal(selected_date, include_unagreed)
-    
-    if not all_plans:
-        return None
-    
-    below_threshold = []
-    
-    for member in all_plans:
-        if member['total_hours'] < threshold:
-            below_threshold.append({
-                'name': member['name'],
-                'hours': member['total_hours'],
-                'pv': member['total_pv'],
-                'shortfall': threshold - member['total_hours'],
-                'agreed_hours': member['agreed_hours'],
-                'agreed_pv': member['agreed_pv']
-            })
-    
-    # Sort by hours (lowest first)
-    below_threshold.sort(key=lambda x: x['hours'])
-    
-    return below_threshold if below_threshold else None
+    return _plan_shortfalls(get_all_members_weekly_plan_internal(selected_date, include_unagreed), threshold)
 
 
 @mcp.tool()
@@ -1240,28 +1186,7 @@ def get_members_below_monthly_threshold(
     - get_members_below_monthly_threshold(selected_date="2026-02-01")
     - get_members_below_monthly_threshold(selected_date="2026-02-15", threshold=160.0, include_unagreed=True)
     """
-    all_plans = get_all_members_monthly_plan_internal(selected_date, include_unagreed)
-    
-    if not all_plans:
-        return None
-    
-    below_threshold = []
-    
-    for member in all_plans:
-        if member['total_hours'] < threshold:
-            below_threshold.append({
-                'name': member['name'],
-                'hours': member['total_hours'],
-                'pv': member['total_pv'],
-                'shortfall': threshold - member['total_hours'],
-                'agreed_hours': member['agreed_hours'],
-                'agreed_pv': member['agreed_pv']
-            })
-    
-    # Sort by hours (lowest first)
-    below_threshold.sort(key=lambda x: x['hours'])
-    
-    return below_threshold if below_threshold else None
+    return _plan_shortfalls(get_all_members_monthly_plan_internal(selected_date, include_unagreed), threshold)
 
 
 # Achievement Analysis - All Members
@@ -1380,28 +1305,9 @@ def get_members_below_weekly_achievement_threshold(
     - get_members_below_weekly_achievement_threshold(selected_date="2026-01-20")
     - get_members_below_weekly_achievement_threshold(selected_date="2026-01-20", status='검수대기')
     """
-    all_achievements = get_all_members_weekly_achievement_internal(selected_date, status, issue_statuses)
-    
-    if not all_achievements:
-        return None
-    
-    below_threshold = []
-    
-    for member in all_achievements:
-        if member['hours'] < threshold:
-            below_threshold.append({
-                'name': member['name'],
-                'hours': member['hours'],
-                'ev': member['ev'],
-                'pv': member['pv'],
-                'cpi': member['cpi'],
-                'shortfall': threshold - member['hours']
-            })
-    
-    # Sort by hours (lowest first)
-    below_threshold.sort(key=lambda x: x['hours'])
-    
-    return below_threshold if below_threshold else None
+    return _achievement_shortfalls(
+        get_all_members_weekly_achievement_internal(selected_date, status, issue_statuses), threshold
+    )
 
 
 @mcp.tool()
@@ -1442,28 +1348,9 @@ def get_members_below_monthly_achievement_threshold(
     - get_members_below_monthly_achievement_threshold(selected_date="2026-01-15")
     - get_members_below_monthly_achievement_threshold(selected_date="2025-12-15", status='검수대기')
     """
-    all_achievements = get_all_members_monthly_achievement_internal(selected_date, status, issue_statuses)
-    
-    if not all_achievements:
-        return None
-    
-    below_threshold = []
-    
-    for member in all_achievements:
-        if member['hours'] < threshold:
-            below_threshold.append({
-                'name': member['name'],
-                'hours': member['hours'],
-                'ev': member['ev'],
-                'pv': member['pv'],
-                'cpi': member['cpi'],
-                'shortfall': threshold - member['hours']
-            })
-    
-    # Sort by hours (lowest first)
-    below_threshold.sort(key=lambda x: x['hours'])
-    
-    return below_threshold if below_threshold else None
+    return _achievement_shortfalls(
+        get_all_members_monthly_achievement_internal(selected_date, status, issue_statuses), threshold
+    )
 
 
 @mcp.tool()
@@ -1559,7 +1446,7 @@ def get_members_below_ytd_target(
             })
     
     # Sort by shortfall (largest shortfall first)
-    below_target.sort(key=lambda x: x['shortfall'], reverse=True)
+    below_target.sort(key=itemgetter('shortfall'), reverse=True)
     
     return below_target if below_target else None
 
@@ -1623,12 +1510,204 @@ def get_members_below_cpi_threshold(
             })
     
     # Sort by CPI (lowest first)
-    below_cpi.sort(key=lambda x: x['ytd_cpi'])
+    below_cpi.sort(key=itemgetter('ytd_cpi'))
+    
+    return below_cpi if below_cpi else None
+
+
+# Compliance Checking - Rules Validation
+def _compliance_inputs(start_date: str, end_date: Optional[str], assigned_to: Optional[str]) -> tuple:
+    """
+    Shared setup of the journal-scanning compliance tools: the date window, the issues updated in it
+    (optionally for one assignee) and their journals. Back-to-back tools over the same window share the
+    issue query through the issue cache and the journals through the detail cache.
+    """
+    start_obj = parse_date(start_date)
+    end_obj = parse_date(end_date) if end_date else _today()
+    
+    # Fetch all issues updated in the date range
+    params = {
+        'updated_on': f'>={start_date}'
+    }
+    if end_date:
+        params['updated_on'] = f'><{start_date}|{end_date}'
+    
+    # Filter by assigned user if specified
+    if assigned_to:
+        member_id = get_member_id(assigned_to, members)
+        params['assigned_to_id'] = member_id
+    
+    issues = fetch_all_issues_cached(params)
+    
+    journals_by_issue = get_issue_journals_many(issues)
+    return start_obj, end_obj, issues, journals_by_issue
+
+def _agreement_removals(issues: list, journals_by_issue: dict, start_obj: datetime.date, end_obj: datetime.date) -> list:
+    """Journal changes that emptied 합의필요사항, made by anyone other than the authorized editor."""
+    violations = []
+    AUTHORIZED_USER_ID = 5  # 박지환(Rex) - authorized to modify agreements
+    
+    for issue in issues:
+        issue_id = issue.get("id")
+        journals = journals_by_issue[issue_id]
+        
+        if not journals:
+            continue
+        
+        for journal in journals:
+            # Skip if changed by authorized user (Rex)
+            user_info = journal.get("user", {})
+            if _user_id(user_info) == AUTHORIZED_USER_ID:
+                continue
+            
+            journal_date = journal.get("created_on", "")
+            if not journal_date:
+                continue
+            
+            # Parse journal date
+            try:
+                journal_obj = _journal_date(journal_date)
+                if not (start_obj <= journal_obj <= end_obj):
+                    continue
+            except ValueError:
+                continue
+            
+            # Check if 합의필요사항 (cf_17) was changed from something to empty
+            for change in journal.get("changes", []):
+                if (change.get("property"), change.get("name")) == _CF_AGREEMENT:
+                    old_val = change.get("old_value")
+                    new_val = change.get("new_value")
+                    
+                    # Violation: had content, now empty
+                    if old_val and not new_val:
+                        user_name = _user_name(user_info)
+                        user_id = _user_id(user_info)
+                        
+                        # Get assigned_to info
+                        assigned_name = _user_name(issue.get("assigned_to"), "Unassigned")
+                        
+                        violations.append({
+                            'issue_id': issue_id,
+                            'subject': issue.get("subject"),
+                            'assigned_to': assigned_name,
+                            'removed_by': user_name,
+                            'removed_by_id': user_id,
+                            'removed_on': journal_date,
+                            'old_value': old_val
+                        })
+    
+    return violations
+
+def _hours_increases(issues: list, journals_by_issue: dict, start_obj: datetime.date, end_obj: datetime.date) -> list:
+    """Estimated-hours increases made inside the window after 합의필요사항 was cleared."""
+    violations = []
+    
+    for issue in issues:
+        issue_id = issue.get("id")
+        journals = journals_by_issue[issue_id]
+        
+        # Track when agreement was cleared
+        agreement_cleared_date = None
+        
+        for journal in journals:
+            journal_date = journal.get("created_on", "")
+            if not journal_date:
+                continue
+            
+            try:
+                journal_day = _journal_date(journal_date)
+            except ValueError:
+                continue
+            
+            # Journals come oldest first, so nothing after the window can be a violation
+            if journal_day > end_obj:
+                break
+            
+            for change in journal.get("changes", []):
+                key = (change.get("property"), change.get("name"))
+                
+                # Track when 합의필요사항 was cleared
+                # Redmine timestamps are all UTC ISO strings, so they order correctly as plain strings
+                if key == _CF_AGREEMENT:
+                    old_val = change.get("old_value")
+                    new_val = change.get("new_value")
+                    if old_val and not new_val:
+                        agreement_cleared_date = journal_date
+                
+                # Check if hours increased AFTER agreement was cleared
+                if key == _ATTR_HOURS:
+                    old_hours = float(change.get("old_value") or 0)
+                    new_hours = float(change.get("new_value") or 0)
+                    
+                    if new_hours > old_hours and agreement_cleared_date and journal_date > agreement_cleared_date:
+                        if start_obj <= journal_day:
+                            # Get assigned_to info
+                            assigned_name = _user_name(issue.get("assigned_to"), "Unassigned")
+                            
+                            # Get user info from journal
+                            user_info = journal.get("user", {})
+                            user_name = _user_name(user_info)
+                            
+                            violations.append({
+                                'issue_id': issue_id,
+                                'subject': issue.get("subject"),
+                                'assigned_to': assigned_name,
+                                'increased_by': user_name,
+                                'increased_on': journal_date,
+                                'old_hours': old_hours,
+                                'new_hours': new_hours,
+                                'increase': new_hours - old_hours
+                            })
+    
+    return violations
+
+def _review_removals(issues: list, journals_by_issue: dict, start_obj: datetime.date, end_obj: datetime.date) -> list:
+    """Journal changes inside the window that took 초기계획WBS off 품질검토필요/성과검토필요."""
+    violations = []
+    
+    for issue in issues:
+        issue_id = issue.get("id")
+        journals = journals_by_issue[issue_id]
+        
+        for journal in journals:
+            journal_date = journal.get("created_on", "")
+            if not journal_date:
+                continue
+            
+            try:
+                journal_obj = _journal_date(journal_date)
+                if not (start_obj <= journal_obj <= end_obj):
+                    continue
+            except ValueError:
+                continue
+            
+            # Check if 초기계획WBS (cf_49) was changed from 품질검토필요 or 성과검토필요
+            for change in journal.get("changes", []):
+                if (change.get("property"), change.get("name")) == _CF_WBS:
+                    old_val = change.get("old_value")
+                    new_val = change.get("new_value")
+                    
+                    # Violation: was 품질검토필요 or 성과검토필요, now removed/changed
+                    if old_val in _REVIEW_WBS_VALUES and new_val not in _REVIEW_WBS_VALUES:
+                        # Get assigned_to info
+                        assigned_name = _user_name(issue.get("assigned_to"), "Unassigned")
+                        
+                        # Get user info from journal
+                        user_info = journal.get("user", {})
+                        user_name = _user_name(user_info)
+                        
+                        violations.append({
+                            'issue_id': issue_id,
+                            'subject': issue.get("subject"),
+                            'assigned_to': assigned_name,
+                            'removed_by': user_name,
+                            'removed_on': journal_date,
+                            'old_value': old_val,
+                            'new_value': new_val
+                        })
     
-    return below_cpi if below_cpi else None
-
+    return violations
 
-# Compliance Checking - Rules Validation
 @mcp.tool()
 def find_agreement_violations_removed(
     start_date: str,
@@ -1669,78 +1748,8 @@ def find_agreement_violations_removed(
     - find_agreement_violations_removed(start_date="2026-01-19", end_date="2026-01-21")
     - find_agreement_violations_removed(start_date="2026-01-19", end_date="2026-01-21", assigned_to="Steven")
     """
-    start_obj = parse_date(start_date)
-    end_obj = parse_date(end_date) if end_date else datetime.date.today()
-    
-    # Fetch all issues updated in the date range
-    params = {
-        'updated_on': f'>={start_date}'
-    }
-    if end_date:
-        params['updated_on'] = f'><{start_date}|{end_date}'
-    
-    # Filter by assigned user if specified
-    if assigned_to:
-        member_id = get_member_id(assigned_to, members)
-        params['assigned_to_id'] = member_id
-    
-    issues = fetch_all_issues(params)
-    
-    if not issues:
-        return None
-    
-    violations = []
-    AUTHORIZED_USER_ID = 5  # 박지환(Rex) - authorized to modify agreements
-    
-    for issue in issues:
-        issue_id = issue.get("id")
-        journals = get_issue_journals(issue_id)
-        
-        if not journals:
-            continue
-        
-        for journal in journals:
-            # Skip if changed by authorized user (Rex)
-            user_info = journal.get("user", {})
-            if isinstance(user_info, dict) and user_info.get("id") == AUTHORIZED_USER_ID:
-                continue
-            
-            journal_date = journal.get("created_on", "")
-            if not journal_date:
-                continue
-            
-            # Parse journal date
-            try:
-                journal_obj = datetime.datetime.fromisoformat(journal_date.replace('Z', '+00:00')).date()
-                if not (start_obj <= journal_obj <= end_obj):
-                    continue
-            except:
-                continue
-            
-            # Check if 합의필요사항 (cf_17) was changed from something to empty
-            for change in journal.get("changes", []):
-                if change.get("property") == "cf" and change.get("name") == "17":  # cf_17 = 합의필요사항
-                    old_val = change.get("old_value")
-                    new_val = change.get("new_value")
-                    
-                    # Violation: had content, now empty
-                    if old_val and not new_val:
-                        user_name = user_info.get("name", "Unknown") if isinstance(user_info, dict) else str(user_info)
-                        user_id = user_info.get("id", None) if isinstance(user_info, dict) else None
-                        
-                        # Get assigned_to info
-                        assigned_user = issue.get("assigned_to", {})
-                        assigned_name = assigned_user.get("name", "Unassigned") if isinstance(assigned_user, dict) else "Unassigned"
-                        
-                        violations.append({
-                            'issue_id': issue_id,
-                            'subject': issue.get("subject"),
-                            'assigned_to': assigned_name,
-                            'removed_by': user_name,
-                            'removed_by_id': user_id,
-                            'removed_on': journal_date,
-                            'old_value': old_val
-                        })
+    start_obj, end_obj, issues, journals_by_issue = _compliance_inputs(start_date, end_date, assigned_to)
+    violations = _agreement_removals(issues, journals_by_issue, start_obj, end_obj)
     
     return violations if violations else None
 
@@ -1783,74 +1792,8 @@ def find_hours_increased_after_agreement(
     - find_hours_increased_after_agreement(start_date="2026-01-01")
     - find_hours_increased_after_agreement(start_date="2026-01-19", end_date="2026-01-21", assigned_to="Steven")
     """
-    start_obj = parse_date(start_date)
-    end_obj = parse_date(end_date) if end_date else datetime.date.today()
-    
-    params = {
-        'updated_on': f'>={start_date}'
-    }
-    if end_date:
-        params['updated_on'] = f'><{start_date}|{end_date}'
-    
-    # Filter by assigned user if specified
-    if assigned_to:
-        member_id = get_member_id(assigned_to, members)
-        params['assigned_to_id'] = member_id
-    
-    issues = fetch_all_issues(params)
-    
-    violations = []
-    
-    for issue in issues:
-        issue_id = issue.get("id")
-        journals = get_issue_journals(issue_id)
-        
-        # Track when agreement was cleared
-        agreement_cleared_date = None
-        
-        for journal in journals:
-            journal_date = journal.get("created_on", "")
-            if not journal_date:
-                continue
-            
-            try:
-                journal_obj = datetime.datetime.fromisoformat(journal_date.replace('Z', '+00:00'))
-            except:
-                continue
-            
-            for change in journal.get("changes", []):
-                # Track when 합의필요사항 was cleared
-                if change.get("property") == "cf" and change.get("name") == "17":
-                    old_val = change.get("old_value")
-                    new_val = change.get("new_value")
-                    if old_val and not new_val:
-                        agreement_cleared_date = journal_obj
-                
-                # Check if hours increased AFTER agreement was cleared
-                if change.get("property") == "attr" and change.get("name") == "estimated_hours":
-                    old_hours = float(change.get("old_value") or 0)
-                    new_hours = float(change.get("new_value") or 0)
-                    
-                    if new_hours > old_hours and agreement_cleared_date and journal_obj > agreement_cleared_date:
-                        if start_obj <= journal_obj.date() <= end_obj:
-                            # Get assigned_to info
-                            assigned_user = issue.get("assigned_to", {})
-                            assigned_name = assigned_user.get("name", "Unassigned") if isinstance(assigned_user, dict) else "Unassigned"
-                            
-                            # Get user info from journal
-                            user_info = journal.get("user", {})
-                            user_name = user_info.get("name", "Unknown") if isinstance(user_info, dict) else str(user_info)
-                            
-                            violations.append({
-                                'issue_id': issue_id,
-                                'subject': issue.get("subject"),
-                                'assigned_to': assigned_name,
-                                'increased_by': user_name,
-                                'increased_on': journal_date,
-                                'old_hours': old_hours,
-                                'new_hours': new_hours,
-                                'increase': new_hours - old_hours
-                            })
+    start_obj, end_obj, issues, journals_by_issue = _compliance_inputs(start_date, end_date, assigned_to)
+    violations = _hours_increases(issues, journals_by_issue, start_obj, end_obj)
     
     return violations if violations else None
 
@@ -1892,67 +1835,54 @@ def find_quality_review_removed(
     - find_quality_review_removed(start_date="2026-01-01")
     - find_quality_review_removed(start_date="2026-01-19", end_date="2026-01-21", assigned_to="Steven")
     """
-    start_obj = parse_date(start_date)
-    end_obj = parse_date(end_date) if end_date else datetime.date.today()
+    start_obj, end_obj, issues, journals_by_issue = _compliance_inputs(start_date, end_date, assigned_to)
+    violations = _review_removals(issues, journals_by_issue, start_obj, end_obj)
     
-    params = {
-        'updated_on': f'>={start_date}'
-    }
-    if end_date:
-        params['updated_on'] = f'><{start_date}|{end_date}'
+    return violations if violations else None
+
+
+@mcp.tool()
+def find_all_process_violations(
+    start_date: str,
+    end_date: Optional[str] = None,
+    assigned_to: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Run the agreement, hours and quality-review checks together over one scan of issue history.
     
-    # Filter by assigned user if specified
-    if assigned_to:
-        member_id = get_member_id(assigned_to, members)
-        params['assigned_to_id'] = member_id
+    Use this instead of calling find_agreement_violations_removed, find_hours_increased_after_agreement
+    and find_quality_review_removed one after another when the user asks for process violations in general.
     
-    issues = fetch_all_issues(params)
+    Use this when user asks:
+    - "이번주 프로세스 위반 사항 전체" (all process violations this week)
+    - "steven task에서 규칙 위반이 있는지" (whether Steven's tasks broke any rules)
     
-    violations = []
+    Parameters:
+    - start_date (str): Start date in YYYY-MM-DD format to check from.
+    - end_date (str, optional): End date in YYYY-MM-DD format. If None, checks up to today.
+    - assigned_to (str, optional): Filter by assigned user name (e.g., "Steven").
+                                   If None, checks all users' tasks.
     
-    for issue in issues:
-        issue_id = issue.get("id")
-        journals = get_issue_journals(issue_id)
-        
-        for journal in journals:
-            journal_date = journal.get("created_on", "")
-            if not journal_date:
-                continue
-            
-            try:
-                journal_obj = datetime.datetime.fromisoformat(journal_date.replace('Z', '+00:00')).date()
-                if not (start_obj <= journal_obj <= end_obj):
-                    continue
-            except:
-                continue
-            
-            # Check if 초기계획WBS (cf_49) was changed from 품질검토필요 or 성과검토필요
-            for change in journal.get("changes", []):
-                if change.get("property") == "cf" and change.get("name") == "49":  # cf_49 = 초기계획WBS
-                    old_val = change.get("old_value")
-                    new_val = change.get("new_value")
-                    
-                    # Violation: was 품질검토필요 or 성과검토필요, now removed/changed
-                    if old_val in ["품질검토필요", "성과검토필요"] and new_val not in ["품질검토필요", "성과검토필요"]:
-                        # Get assigned_to info
-                        assigned_user = issue.get("assigned_to", {})
-                        assigned_name = assigned_user.get("name", "Unassigned") if isinstance(assigned_user, dict) else "Unassigned"
-                        
-                        # Get user info from journal
-                        user_info = journal.get("user", {})
-                        user_name = user_info.get("name", "Unknown") if isinstance(user_info, dict) else str(user_info)
-                        
-                        violations.append({
-                            'issue_id': issue_id,
-                            'subject': issue.get("subject"),
-                            'assigned_to': assigned_name,
-                            'removed_by': user_name,
-                            'removed_on': journal_date,
-                            'old_value': old_val,
-                            'new_value': new_val
-                        })
+    Returns:
+    - dict | None: Violations grouped by check, each in the format of the corresponding tool:
+      * 'agreement_removed': as find_agreement_violations_removed
+      * 'hours_increased': as find_hours_increased_after_agreement
+      * 'quality_review_removed': as find_quality_review_removed
+      Checks without violations are left out. Returns None if no violations found.
     
-    return violations if violations else None
+    Usage examples:
+    - find_all_process_violations(start_date="2026-01-19")
+    - find_all_process_violations(start_date="2026-01-19", end_date="2026-01-21", assigned_to="Steven")
+    """
+    start_obj, end_obj, issues, journals_by_issue = _compliance_inputs(start_date, end_date, assigned_to)
+    results = {
+        'agreement_removed': _agreement_removals(issues, journals_by_issue, start_obj, end_obj),
+        'hours_increased': _hours_increases(issues, journals_by_issue, start_obj, end_obj),
+        'quality_review_removed': _review_removals(issues, journals_by_issue, start_obj, end_obj),
+    }
+    results = {check: violations for check, violations in results.items() if violations}
+    
+    return results if results else None
 
 
 @mcp.tool()
@@ -1993,7 +1923,7 @@ def find_completed_mng_without_template(
     - find_completed_mng_without_template(start_date="2026-01-19", end_date="2026-01-21", assigned_to="Steven")
     """
     start_obj = parse_date(start_date)
-    end_obj = parse_date(end_date) if end_date else datetime.date.today()
+    end_obj = parse_date(end_date) if end_date else _today()
     
     # Fetch completed Mng tasks
     params = {
@@ -2013,22 +1943,24 @@ def find_completed_mng_without_template(
     
     results = []
     
+    journals_by_issue = get_issue_journals_many(issues)
+    
     for issue in issues:
         issue_id = issue.get("id")
-        journals = get_issue_journals(issue_id)
+        journals = journals_by_issue[issue_id]
         
         # Find when it was completed
         completed_on = None
         for journal in journals:
             for change in journal.get("changes", []):
-                if change.get("property") == "attr" and change.get("name") == "status_id":
+                if (change.get("property"), change.get("name")) == _ATTR_STATUS:
                     if change.get("new_value") == "5":  # Changed to 완료됨
                         completed_on = journal.get("created_on")
                         break
         
         if completed_on:
             try:
-                completed_obj = datetime.datetime.fromisoformat(completed_on.replace('Z', '+00:00')).date()
+                completed_obj = _journal_date(completed_on)
                 if start_obj <= completed_obj <= end_obj:
                     results.append({
                         'issue_id': issue_id,
@@ -2037,7 +1969,7 @@ def find_completed_mng_without_template(
                         'completed_on': completed_on,
                         'estimated_hours': issue.get("estimated_hours")
                     })
-            except:
+            except ValueError:
                 pass
     
     return results if results else None
@@ -2081,7 +2013,7 @@ def find_completed_tasks_without_attachments(
     - find_completed_tasks_without_attachments(start_date="2026-01-19", end_date="2026-01-21", assigned_to="Steven")
     """
     start_obj = parse_date(start_date)
-    end_obj = parse_date(end_date) if end_date else datetime.date.today()
+    end_obj = parse_date(end_date) if end_date else _today()
     
     # Fetch completed tasks
     params = {
@@ -2096,21 +2028,20 @@ def find_completed_tasks_without_attachments(
         member_id = get_member_id(assigned_to, members)
         params['assigned_to_id'] = member_id
     
-    issues = fetch_all_issues(params)
+    # The listing already carries each description, so only tasks without one need their journals checked
+    issues = [issue for issue in fetch_all_issues(params) if not (issue.get("description") or "").strip()]
     
     results = []
     
+    details_by_issue = get_issue_details_many(issues, include='journals')
+    
     for issue in issues:
         issue_id = issue.get("id")
         
-        # Get full issue details to check description
-        full_issue = get_issue_details(issue_id)
+        full_issue = details_by_issue[issue_id]
         if not full_issue:
             continue
         
-        # Check if has description or notes
-        has_description = bool(full_issue.get("description", "").strip())
-        
         # Check if has notes in journals
         has_notes = False
         journals = full_issue.get("journals", [])
@@ -2119,20 +2050,20 @@ def find_completed_tasks_without_attachments(
                 has_notes = True
                 break
         
-        # If no description and no notes, it's missing documentation
-        if not has_description and not has_notes:
+        # No description (filtered above) and no notes means it's missing documentation
+        if not has_notes:
             # Find when it was completed
             completed_on = None
             for journal in journals:
                 for change in journal.get("changes", []):
-                    if change.get("property") == "attr" and change.get("name") == "status_id":
+                    if (change.get("property"), change.get("name")) == _ATTR_STATUS:
                         if change.get("new_value") == "5":  # Changed to 완료됨
                             completed_on = journal.get("created_on")
                             break
             
             if completed_on:
                 try:
-                    completed_obj = datetime.datetime.fromisoformat(completed_on.replace('Z', '+00:00')).date()
+                    completed_obj = _journal_date(completed_on)
                     if start_obj <= completed_obj <= end_obj:
                         results.append({
                             'issue_id': issue_id,
@@ -2142,7 +2073,7 @@ def find_completed_tasks_without_attachments(
                             'completed_on': completed_on,
                             'estimated_hours': issue.get("estimated_hours")
                         })
-                except:
+                except ValueError:
                     pass
     
     return results if results else None
@@ -2188,8 +2119,7 @@ def find_sprint_transfers_after_underachievement(
     - find_sprint_transfers_after_underachievement(last_week_date="2026-01-13")
     - find_sprint_transfers_after_underachievement(last_week_date="2026-01-13", assigned_to="Steven")
     """
-    date_obj = parse_date(last_week_date)
-    week_label, month_label = get_week_and_month_label(date_obj)
+    date_obj, week_label, month_label = parse_date_with_labels(last_week_date)
     status_id = parse_status_param('검수대기,승인대기,완료요청,완료됨', issue_statuses)
     
     # If specific user requested, check only that user
@@ -2210,14 +2140,14 @@ def find_sprint_transfers_after_underachievement(
         # Calculate achievement hours
         total_hours = 0.0
         for issue in issues:
-            hours = float(issue.get("estimated_hours", 0) or 0)
+            hours = to_float(issue.get("estimated_hours"))
             total_hours += hours
         
         if total_hours >= threshold:
             return None  # This member met the threshold
         
         # Get user info
-        users = fetch_all_users({'status': 1})
+        users = fetch_active_users()
         member_name = assigned_to
         for user in users:
             if user.get('id') == member_id:
@@ -2241,26 +2171,25 @@ def find_sprint_transfers_after_underachievement(
         if not under_achievers:
             return None
     
+    # Fetch that year's issues of every under-achiever in one query, grouped by assignee
+    issues_by_member = fetch_issues_by_assignee({
+        'assigned_to_id': '|'.join(str(member['member_id']) for member in under_achievers),
+        'cf_38': str(date_obj.year),
+        'updated_on': f'>={last_week_date}'
+    })
+    journals_by_issue = get_issue_journals_many(issue for issues in issues_by_member.values() for issue in issues)
+    
     violations = []
     
     for member in under_achievers:
         name = member['name']
         member_id = member['member_id']
         
-        # Fetch issues assigned to this member in that year
-        params = {
-            'assigned_to_id': member_id,
-            'cf_38': str(date_obj.year),
-            'updated_on': f'>={last_week_date}'
-        }
-        
-        issues = fetch_all_issues(params)
-        
         transferred_issues = []
         
-        for issue in issues:
+        for issue in issues_by_member.get(member_id, ()):
             issue_id = issue.get("id")
-            journals = get_issue_journals(issue_id)
+            journals = journals_by_issue[issue_id]
             
             for journal in journals:
                 # Check if 스프린트(주) (cf_41) was changed
@@ -2271,37 +2200,35 @@ def find_sprint_transfers_after_underachievement(
                 new_month = None
                 
                 for change in journal.get("changes", []):
-                    if change.get("property") == "cf" and change.get("name") == "41":  # cf_41 = 스프린트(주)
+                    key = (change.get("property"), change.get("name"))
+                    if key == _CF_SPRINT_WEEK:
                         old_week = change.get("old_value")
                         new_week = change.get("new_value")
-                    elif change.get("property") == "cf" and change.get("name") == "42":  # cf_42 = 스프린트(월)
+                    elif key == _CF_SPRINT_MONTH:
                         old_month = change.get("old_value")
                         new_month = change.get("new_value")
                 
                 # Check if moved FROM last week (and correct month) TO an earlier week
                 # Only flag transfers from the specific week AND month being checked
                 if old_week and new_week and old_week == week_label and (old_month == month_label or old_month is None):
-                    try:
-                        old_week_num = int(old_week.replace("주차", ""))
-                        new_week_num = int(new_week.replace("주차", ""))
+                    old_week_num = parse_week_label(old_week)
+                    new_week_num = parse_week_label(new_week)
+                    
+                    if old_week_num is not None and new_week_num is not None and new_week_num < old_week_num:  # Moved to earlier week
+                        # Get user info from journal
+                        user_info = journal.get("user", {})
+                        user_name = _user_name(user_info)
                         
-                        if new_week_num < old_week_num:  # Moved to earlier week
-                            # Get user info from journal
-                            user_info = journal.get("user", {})
-                            user_name = user_info.get("name", "Unknown") if isinstance(user_info, dict) else str(user_info)
-                            
-                            transferred_issues.append({
-                                'issue_id': issue_id,
-                                'subject': issue.get("subject"),
-                                'transferred_by': user_name,
-                                'transferred_on': journal.get("created_on"),
-                                'old_sprint_week': old_week,
-                                'new_sprint_week': new_week,
-                                'old_sprint_month': old_month if old_month else month_label,
-                                'new_sprint_month': new_month if new_month else "(unchanged)"
-                            })
-                    except:
-                        pass
+                        transferred_issues.append({
+                            'issue_id': issue_id,
+                            'subject': issue.get("subject"),
+                            'transferred_by': user_name,
+                            'transferred_on': journal.get("created_on"),
+                            'old_sprint_week': old_week,
+                            'new_sprint_week': new_week,
+                            'old_sprint_month': old_month if old_month else month_label,
+                            'new_sprint_month': new_month if new_month else "(unchanged)"
+                        })
         
         if transferred_issues:
             violations.append({
@@ -2497,8 +2424,39 @@ def find_duplicate_issues_across_users(
     )
 
 
+# Admin
+@mcp.tool()
+def clear_socramine_caches() -> str:
+    """
+    Clear the server's in-memory Redmine lookup caches.
+    
+    Use this only when the user says that projects or users were just renamed, created,
+    or deactivated and lookups are returning stale or missing results.
+    
+    Returns:
+    - str: Confirmation message.
+    
+    Usage examples:
+    - clear_socramine_caches()
+    """
+    clear_caches()
+    return "Caches cleared"
+
+
 def main():
     """Main entry point for the mcp-socramine package."""
+    if os.environ.get('SOCRAMINE_WARM') == '1':
+        warm_caches()
+    refresh_interval = os.environ.get('SOCRAMINE_REFRESH_INTERVAL')
+    if refresh_interval:
+        try:
+            interval = float(refresh_interval)
+        except ValueError:
+            interval = None
+        if interval is not None and 0 < interval < float('inf'):
+            start_cache_refresher(interval)
+        else:
+            logger.warning("Ignoring SOCRAMINE_REFRESH_INTERVAL=%r: expected a positive number of seconds", refresh_interval)
     mcp.run()
 
 if __name__ == "__main__":